@@ -0,0 +1,235 @@
+"""
+Direct animated GIF / WebP output.
+
+Frames go straight from the renderer into the encoder, with no movie and
+no intermediate files:
+
+  - every frame is quantized with one fixed palette, built once from the
+    scene's own colors (its `palette` class attribute), via a 15-bit
+    lookup table instead of a per-frame palette search;
+  - identical consecutive frames are merged into one longer frame, and a
+    frame identical to the previous raw frame is not even quantized;
+  - GIF frames are streamed to disk as they arrive and only the rectangle
+    that changed since the previous frame is written;
+  - WebP frames are kept as 8-bit paletted images and handed to libwebp,
+    which does its own changed-rectangle encoding, when the scene ends.
+
+Usage, with a scene's renderer:
+
+    writer = AnimatedImageWriter("out.gif", fps=15, colors=scene.palette)
+    scene.renderer.file_writer.write_frame = writer.write_frame
+    scene.render()
+    stats = writer.close()
+"""
+
+from pathlib import Path
+import time
+
+import numpy as np
+from PIL import GifImagePlugin, Image
+from manim import BLACK, WHITE, ManimColor
+
+PALETTE_SIZE = 256
+GRAY_LEVELS = 32
+# Browsers slow down GIF frames shorter than 2 centiseconds; drop frames instead
+MIN_GIF_FRAME_CS = 2
+
+
+def _rgb255(color):
+    return np.rint(np.asarray(ManimColor(color).to_rgb(), dtype=np.float64) * 255)
+
+
+def build_palette(colors=None, background=BLACK, size=PALETTE_SIZE, gray_levels=GRAY_LEVELS):
+    """
+    (n, 3) uint8 palette for a scene drawn in a few flat colors on a plain
+    background: a ramp from the background to each color (fill opacities
+    and antialiased edges land on it) plus a gray ramp for white text.
+    Without colors, a 6x6x6 color cube and a gray ramp.
+    """
+    bg = _rgb255(background)
+    ramps = [bg + (_rgb255(WHITE) - bg) * np.linspace(0, 1, gray_levels)[:, None]]
+    if colors:
+        targets = np.unique(np.array([_rgb255(c) for c in colors]), axis=0)
+        steps = max(2, (size - gray_levels) // len(targets))
+        t = np.linspace(0, 1, steps)[:, None]
+        ramps += [bg + (c - bg) * t for c in targets]
+    else:
+        levels = np.linspace(0, 255, 6)
+        ramps.append(np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), -1).reshape(-1, 3))
+
+    palette = np.unique(np.rint(np.concatenate(ramps)).astype(np.uint8), axis=0)
+    return palette[:size]
+
+
+def quantization_lut(palette, exact=()):
+    """
+    Nearest palette index for every 15-bit color (5 bits per channel),
+    as a 32768-entry uint8 table. Colors in `exact` (the background and
+    the scene's own colors) are pinned so they map to themselves even
+    when a darker ramp step shares their 15-bit cell.
+    """
+    levels = np.arange(32, dtype=np.float32) * 8 + 4
+    grid = np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), -1).reshape(-1, 3)
+    pal = palette.astype(np.float32)
+    lut = np.empty(len(grid), dtype=np.uint8)
+    for start in range(0, len(grid), 4096):
+        block = grid[start:start + 4096]
+        dist = ((block[:, None, :] - pal[None]) ** 2).sum(axis=2)
+        lut[start:start + 4096] = dist.argmin(axis=1)
+
+    for color in exact:
+        rgb = _rgb255(color).astype(int)
+        r, g, b = rgb >> 3
+        lut[(r << 10) | (g << 5) | b] = ((pal - rgb) ** 2).sum(axis=1).argmin()
+    return lut
+
+
+def quantize(frame, lut):
+    """(H, W) palette indices for an (H, W, 3 or 4) uint8 frame."""
+    rgb = frame[..., :3].astype(np.uint16) >> 3
+    return lut[(rgb[..., 0] << 10) | (rgb[..., 1] << 5) | rgb[..., 2]]
+
+
+def changed_box(previous, current):
+    """(x0, y0, x1, y1) of the pixels that differ, or None."""
+    diff = previous != current
+    rows = np.flatnonzero(diff.any(axis=1))
+    if not len(rows):
+        return None
+    cols = np.flatnonzero(diff.any(axis=0))
+    return cols[0], rows[0], cols[-1] + 1, rows[-1] + 1
+
+
+class AnimatedImageWriter:
+    """
+    Encodes frames to an animated .gif or .webp. write_frame has the same
+    signature as SceneFileWriter.write_frame so it can replace it.
+    colors are the scene's flat colors the palette is built from.
+    """
+
+    def __init__(self, path, fps, colors=None, background=BLACK, loop=0, lossless=True, quality=80):
+        self.path = Path(path)
+        self.format = self.path.suffix.lower().lstrip(".")
+        if self.format not in ("gif", "webp"):
+            raise ValueError(f"Unsupported animated format: {self.path.suffix}")
+        self.fps = fps
+        self.loop = loop
+        self.lossless = lossless
+        self.quality = quality
+
+        colors = list(colors or [])
+        self.palette = build_palette(colors, background)
+        self.lut = quantization_lut(self.palette, exact=[background, WHITE, *colors])
+        padded = np.zeros((PALETTE_SIZE, 3), dtype=np.uint8)
+        padded[:len(self.palette)] = self.palette
+        self._palette_bytes = padded.tobytes()
+
+        self.frames_in = 0
+        self.frames_out = 0
+        self.seconds = 0.0
+        # Frame waiting for its duration to be known: (indices, first frame number)
+        self._pending = None
+        self._last_raw = None
+        self._canvas = None
+        self._file = None
+        self._webp_frames = []
+        self._webp_durations = []
+
+    # --- Timing ---
+
+    def _gif_cs(self, frame_number):
+        return round(frame_number * 100 / self.fps)
+
+    def _too_short(self, start, end):
+        return self.format == "gif" and self._gif_cs(end) - self._gif_cs(start) < MIN_GIF_FRAME_CS
+
+    # --- Input ---
+
+    def write_frame(self, frame, num_frames=1):
+        start = time.perf_counter()
+        if self._pending is not None and np.array_equal(self._last_raw, frame):
+            # Same raw frame as last time (a wait): extend the hold without quantizing
+            self.frames_in += num_frames
+            self.seconds += time.perf_counter() - start
+            return
+        self._last_raw = frame
+        indices = quantize(frame, self.lut)
+        if self._pending is not None:
+            pending, first = self._pending
+            if np.array_equal(pending, indices):
+                # Hold: the pending frame simply lasts longer
+                pass
+            elif self._too_short(first, self.frames_in):
+                # Replace a frame too short to show, keeping its start time
+                self._pending = (indices, first)
+            else:
+                self._emit(pending, first, self.frames_in)
+                self._pending = (indices, self.frames_in)
+        else:
+            self._pending = (indices, self.frames_in)
+        self.frames_in += num_frames
+        self.seconds += time.perf_counter() - start
+
+    def close(self):
+        """Write the last frame and finish the file. Returns encoding stats."""
+        start = time.perf_counter()
+        if self._pending is not None:
+            self._emit(*self._pending, self.frames_in)
+            self._pending = None
+        if self.format == "gif":
+            if self._file is not None:
+                self._file.write(b";")
+                self._file.close()
+                self._file = None
+        elif self._webp_frames:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            first, *rest = self._webp_frames
+            first.save(
+                self.path, save_all=True, append_images=rest, duration=self._webp_durations,
+                loop=self.loop, lossless=self.lossless, quality=self.quality, method=4,
+            )
+            self._webp_frames = []
+        self.seconds += time.perf_counter() - start
+        return {
+            "path": self.path,
+            "bytes": self.path.stat().st_size if self.path.exists() else 0,
+            "frames_in": self.frames_in,
+            "frames_out": self.frames_out,
+            "seconds": self.seconds,
+        }
+
+    # --- Output ---
+
+    def _image(self, indices):
+        im = Image.fromarray(np.ascontiguousarray(indices))
+        im.putpalette(self._palette_bytes)
+        return im
+
+    def _emit(self, indices, first, end):
+        if self.format == "gif":
+            self._emit_gif(indices, first, end)
+        else:
+            start_ms = round(first * 1000 / self.fps)
+            self._webp_durations.append(round(end * 1000 / self.fps) - start_ms)
+            self._webp_frames.append(self._image(indices))
+        self.frames_out += 1
+
+    def _emit_gif(self, indices, first, end):
+        duration = (self._gif_cs(end) - self._gif_cs(first)) * 10
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("wb")
+            header, _ = GifImagePlugin.getheader(self._image(indices), info={"loop": self.loop})
+            self._file.write(b"".join(header))
+            box = (0, 0, indices.shape[1], indices.shape[0])
+        else:
+            box = changed_box(self._canvas, indices)
+            if box is None:
+                # Same picture as already on screen (e.g. after a dropped frame)
+                box = (0, 0, 1, 1)
+        x0, y0, x1, y1 = box
+        part = self._image(indices[y0:y1, x0:x1])
+        # disposal=1: keep the previous frame underneath the changed rectangle
+        for chunk in GifImagePlugin.getdata(part, offset=(x0, y0), duration=duration, disposal=1):
+            self._file.write(chunk)
+        self._canvas = indices
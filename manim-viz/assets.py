@@ -0,0 +1,204 @@
+"""
+Web-ready variants of a rendered animation.
+
+Decodes a published MP4 or GIF once and writes, next to it in static/:
+
+  <stem>-<w>.mp4       H.264, one per width (1x and 2x)
+  <stem>-<w>.av1.mp4   AV1, when the local FFmpeg build has an AV1 encoder
+  <stem>-<w>.webp      animated WebP fallback at 1x
+  <stem>-poster.png    last frame at the widest width
+
+plus the Hugo shortcode call that embeds them (layouts/shortcodes/anim.html)
+with width, height and preload set. Frames are resized by FFmpeg's scaler
+and streamed to every encoder in the same pass.
+
+Run with: python assets.py                                   (every published animation)
+          python assets.py ../static/video/attention/SelfAttentionAnimation.mp4
+"""
+
+from fractions import Fraction
+from pathlib import Path
+import argparse
+import time
+
+from render import SCENES, STATIC
+
+# CSS width of the post column; 2x is for high-density screens
+WIDTH_1X = 720
+WIDTH_2X = 1440
+MAX_FPS = 30
+AV1_ENCODERS = {
+    "libsvtav1": {"crf": "40", "preset": "8"},
+    "libaom-av1": {"crf": "38", "cpu-used": "6", "row-mt": "1"},
+}
+H264_OPTIONS = {"crf": "26", "preset": "slow", "tune": "animation"}
+
+
+def av1_encoder():
+    """Name of the first available AV1 encoder, or None."""
+    import av
+
+    return next((name for name in AV1_ENCODERS if name in av.codecs_available), None)
+
+
+def even(n):
+    return max(2, int(round(n / 2)) * 2)
+
+
+def variant_sizes(width, height):
+    """[(w, h)] for the 1x and 2x widths, never upscaling the source."""
+    sizes = []
+    for target in (WIDTH_1X, WIDTH_2X):
+        w = even(min(target, width))
+        size = (w, even(height * w / width))
+        if size not in sizes:
+            sizes.append(size)
+    return sizes
+
+
+class _VideoOutput:
+    """One encoder writing one MP4 file."""
+
+    def __init__(self, path, codec, options, size, fps):
+        import av
+
+        self.path = path
+        self.size = size
+        self.container = av.open(str(path), "w", options={"movflags": "+faststart"})
+        self.stream = self.container.add_stream(codec, rate=fps, options=options)
+        self.stream.width, self.stream.height = size
+        self.stream.pix_fmt = "yuv420p"
+        self.stream.codec_context.time_base = Fraction(1, fps)
+
+    def write(self, frame):
+        for packet in self.stream.encode(frame):
+            self.container.mux(packet)
+
+    def close(self):
+        for packet in self.stream.encode():
+            self.container.mux(packet)
+        self.container.close()
+
+
+def build_assets(source, alt=None, preload="metadata"):
+    """
+    Write all variants of `source` next to it. Returns a dict with the
+    written files, the 1x size and the shortcode snippet.
+    """
+    import av
+    from animated_image import AnimatedImageWriter
+
+    source = Path(source)
+    start = time.perf_counter()
+    stem = source.with_suffix("")
+
+    with av.open(str(source)) as container:
+        stream = container.streams.video[0]
+        rate = stream.average_rate or stream.guessed_rate or MAX_FPS
+        fps = min(MAX_FPS, max(1, round(float(rate))))
+        sizes = variant_sizes(stream.codec_context.width, stream.codec_context.height)
+
+        av1 = av1_encoder()
+        outputs = []
+        for size in sizes:
+            outputs.append(_VideoOutput(stem.with_name(f"{stem.name}-{size[0]}.mp4"), "libx264",
+                                        H264_OPTIONS, size, fps))
+            if av1:
+                outputs.append(_VideoOutput(stem.with_name(f"{stem.name}-{size[0]}.av1.mp4"), av1,
+                                            AV1_ENCODERS[av1], size, fps))
+        webp = AnimatedImageWriter(stem.with_name(f"{stem.name}-{sizes[0][0]}.webp"), fps=fps)
+
+        index = 0
+        last = None
+        gap = 1 / fps
+
+        def emit(frame, until):
+            # Repeat frame on the constant-rate output grid up to time `until`
+            nonlocal index
+            while index < round(until * fps):
+                for out in outputs:
+                    scaled = frame.reformat(width=out.size[0], height=out.size[1],
+                                            format="yuv420p", interpolation="LANCZOS")
+                    scaled.pts = index
+                    scaled.time_base = out.stream.codec_context.time_base
+                    out.write(scaled)
+                small = frame.reformat(width=sizes[0][0], height=sizes[0][1], format="rgb24")
+                webp.write_frame(small.to_ndarray())
+                index += 1
+
+        for frame in container.decode(stream):
+            if frame.time is None:
+                continue
+            if last is not None:
+                gap = frame.time - last.time
+                emit(last, frame.time)
+            last = frame
+        if last is None:
+            raise ValueError(f"No video frames in {source}")
+        # The last frame lasts until the container's end (GIF holds are one long frame)
+        total = container.duration / av.time_base if container.duration else 0.0
+        emit(last, max(total, last.time + gap, (index + 1) / fps))
+
+    for out in outputs:
+        out.close()
+    webp_stats = webp.close()
+
+    poster = stem.with_name(f"{stem.name}-poster.png")
+    last.to_image().resize(sizes[-1]).save(poster, optimize=True)
+
+    files = [out.path for out in outputs] + [webp_stats["path"], poster]
+    (w, h), w2 = sizes[0], (sizes[-1][0] if len(sizes) > 1 else None)
+    src = "/" + stem.relative_to(STATIC).as_posix()
+    params = [f'src="{src}"', f'width="{w}"', f'height="{h}"']
+    if w2:
+        params.append(f'width2x="{w2}"')
+    if av1:
+        params.append('av1="true"')
+    params += [f'preload="{preload}"', f'alt="{alt or stem.name}"',
+               f'fallback="/{source.relative_to(STATIC).as_posix()}"']
+    return {
+        "files": files,
+        "bytes": sum(p.stat().st_size for p in files),
+        "source_bytes": source.stat().st_size,
+        "size": (w, h),
+        "seconds": time.perf_counter() - start,
+        "shortcode": "{{< anim " + " ".join(params) + " >}}",
+    }
+
+
+def assets_stale(source):
+    """Whether any variant of source is missing or older than it."""
+    source = Path(source)
+    poster = source.with_name(f"{source.stem}-poster.png")
+    return not poster.exists() or poster.stat().st_mtime < source.stat().st_mtime
+
+
+def published_animations():
+    """static/ paths of every animated scene output in render.SCENES."""
+    return [
+        STATIC / s["output"] for s in SCENES.values()
+        if s["output"] and s["format"] in ("mp4", "gif") and (STATIC / s["output"]).exists()
+    ]
+
+
+def print_result(source, result):
+    print(
+        f"{Path(source).name}: {len(result['files'])} files, "
+        f"{result['bytes'] / 1e6:.2f} MB total vs {result['source_bytes'] / 1e6:.2f} MB source "
+        f"({result['seconds']:.1f}s)"
+    )
+    print(f"    {result['shortcode']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("sources", nargs="*", type=Path, help="rendered MP4/GIF files (default: all published)")
+    parser.add_argument("--preload", default="metadata", choices=["none", "metadata", "auto"])
+    args = parser.parse_args()
+
+    for source in args.sources or published_animations():
+        print_result(source, build_assets(source.resolve(), preload=args.preload))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,19 @@
 from manim import *
 import numpy as np
 
+from attention_engine import attention_layers, project_2d, token_embeddings
+from background_cache import BackgroundCacheScene
+from components import TextPanel, make_fitted_chip
+from point_cloud import VectorCloud
+from positional_encoding import pe_matrix
+from text_cache import cached_text, log_text_cache_stats
+
+
+class AttentionBankVisualization(BackgroundCacheScene):
+    # Colors the direct GIF/WebP encoder builds its palette from
+    # (BLUE_D is NumberPlane's grid color)
+    palette = [WHITE, YELLOW, BLUE, TEAL, GREEN, ORANGE, RED, BLUE_D]
 
-class AttentionBankVisualization(Scene):
     def setup_axes(self):
         axes = Axes(
             x_range=[-6, 6, 1],
@@ -18,7 +29,8 @@ class AttentionBankVisualization(Scene):
             y_length=7,
             background_line_style={"stroke_opacity": 0.25},
         )
-        self.add(plane, axes)
+        # Never animated: rasterized once for the whole scene
+        self.add_background(plane, axes)
         return axes
 
     def vec_arrow(self, axes, vec, color=WHITE, label=None, label_buff=0.15):
@@ -32,37 +44,54 @@ class AttentionBankVisualization(Scene):
         )
         if label is None:
             return arr, None
-        lab = Text(label, font_size=30, weight=BOLD, color=color).next_to(
+        lab = cached_text(label, font_size=30, weight=BOLD, color=color).next_to(
             arr.get_end(), UR, buff=label_buff
         )
         return arr, lab
 
     def token_box(self, text, color=WHITE):
-        t = Text(text, font_size=34, weight=BOLD, color=color)
-        box = RoundedRectangle(
-            corner_radius=0.2, height=t.height + 0.45, width=t.width + 0.7
-        )
-        box.set_stroke(color, 3)
-        box.set_fill(color, opacity=0.08)
-        g = VGroup(box, t)
-        t.move_to(box.get_center())
-        return g
-
-    def attention_bubble(self, title, lines, width=4.2):
-        header = Text(title, font_size=26, weight=BOLD)
-        body = VGroup(*[Text(l, font_size=22) for l in lines]).arrange(
-            DOWN, aligned_edge=LEFT, buff=0.18
-        )
-        content = VGroup(header, body).arrange(DOWN, aligned_edge=LEFT, buff=0.25)
+        return make_fitted_chip(text, color=color)
 
-        panel = RoundedRectangle(
-            corner_radius=0.25, width=width, height=content.height + 0.6
-        )
-        panel.set_stroke(WHITE, 2)
-        panel.set_fill(BLACK, opacity=0.65)
-        content.move_to(panel.get_center())
+    def attention_bubble(self, title, lines, width=4.2, n_lines=None):
+        return TextPanel(title, lines, n_lines=n_lines, width=width)
+
+    def set_arrow_ends(self, arrow, start, end):
+        """
+        Move a vec_arrow to new ends in place: the shaft's two points and the
+        tip triangle's three corners, sized like Arrow sizes them.
+        """
+        start, end = np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+        vec = end - start
+        length = np.linalg.norm(vec)
+        unit = vec / length if length > 0 else np.zeros(3)
+        tip = min(arrow.tip_length, arrow.max_tip_length_to_length_ratio * length)
+        base = end - unit * tip
+        side = np.array([-unit[1], unit[0], 0.0]) * tip / 2
+        arrow.set_points_as_corners([start, base])
+        arrow.tip.set_points_as_corners([end, base + side, base - side, end])
+        return arrow
+
+    def tracked_arrow(self, axes, tracker, color=WHITE, label=None, label_buff=0.15):
+        """
+        vec_arrow that follows tracker (a ComplexValueTracker holding the
+        vector as x + iy) through updaters instead of being rebuilt.
+        """
+        value = tracker.get_value()
+        arr, lab = self.vec_arrow(axes, (value.real, value.imag), color, label, label_buff)
+        drawn = [value]
+
+        def follow(m):
+            # Arrow.put_start_and_end_on shortens the shaft by the tip on every
+            # call, so set the points directly, and only when the vector moved
+            value = tracker.get_value()
+            if value != drawn[0]:
+                self.set_arrow_ends(m, axes.c2p(0, 0), axes.c2p(value.real, value.imag))
+                drawn[0] = value
 
-        return VGroup(panel, content)
+        arr.add_updater(follow)
+        if lab is not None:
+            lab.add_updater(lambda m: m.next_to(arr.get_end(), UR, buff=label_buff))
+        return arr, lab
 
     def shift_with_attention(
         self,
@@ -82,9 +111,10 @@ class AttentionBankVisualization(Scene):
         )
         current_vec = base_vec.copy()
 
-        # Current (contextualized) arrow
-        cur_arrow, cur_lab = self.vec_arrow(
-            axes, current_vec, color=BLUE, label=subtitle
+        # Current (contextualized) arrow, following the tracked vector
+        cur_vec = ComplexValueTracker(complex(*current_vec))
+        cur_arrow, cur_lab = self.tracked_arrow(
+            axes, cur_vec, color=BLUE, label=subtitle
         )
 
         # Token chips
@@ -96,13 +126,13 @@ class AttentionBankVisualization(Scene):
 
         # Attention panel
         panel = self.attention_bubble(
-            title, ["start with: bank", "add tokens → bank shifts"], width=4.6
+            title, ["start with: bank", "add tokens → bank shifts"], width=4.6, n_lines=3
         ).to_corner(DR, buff=0.25)
 
         # Optional sentence line
         sent = None
         if sentence_text:
-            sent = Text(sentence_text, font_size=32)
+            sent = cached_text(sentence_text, font_size=32)
             sent.to_edge(UP).shift(DOWN * 0.35)
 
         # Draw initial state
@@ -134,10 +164,7 @@ class AttentionBankVisualization(Scene):
                 f"add: {u['token']}  (w={u['weight']:.2f})",
                 "→ update bank'",
             ]
-            new_panel = self.attention_bubble(title, new_lines, width=4.6).move_to(
-                panel.get_center()
-            )
-            self.play(Transform(panel, new_panel), run_time=0.35)
+            self.play(panel.set_lines(new_lines), run_time=0.35)
 
             # Compute next vector
             delta = u["delta"] * u["weight"]
@@ -154,15 +181,8 @@ class AttentionBankVisualization(Scene):
             )
             self.play(FadeIn(dot, scale=0.8), Create(move_line), run_time=0.35)
 
-            # Transform arrow to the new endpoint
-            new_arrow, new_lab = self.vec_arrow(
-                axes, next_vec, color=BLUE, label=subtitle
-            )
-            self.play(
-                Transform(cur_arrow, new_arrow),
-                Transform(cur_lab, new_lab),
-                run_time=0.7,
-            )
+            # Move the tracked vector; arrow and label follow
+            self.play(cur_vec.animate.set_value(complex(*next_vec)), run_time=0.7)
 
             trail.add(dot, move_line)
             current_vec = next_vec
@@ -171,12 +191,13 @@ class AttentionBankVisualization(Scene):
             self.play(chip.animate.set_opacity(0.6), run_time=0.25)
 
         # Final panel
-        final_panel = self.attention_bubble(
-            title,
-            ["bank' = bank + Σ (wᵢ · tokenᵢ)", "context-specific meaning"],
-            width=4.6,
-        ).move_to(panel.get_center())
-        self.play(Transform(panel, final_panel), run_time=0.5)
+        self.play(
+            panel.set_lines(["bank' = bank + Σ (wᵢ · tokenᵢ)", "context-specific meaning"]),
+            run_time=0.5,
+        )
+        cur_arrow.clear_updaters()
+        if cur_lab is not None:
+            cur_lab.clear_updaters()
 
         return {
             "base_arrow": base_arrow,
@@ -259,3 +280,74 @@ class AttentionBankVisualization(Scene):
         # Keep final state on screen
         self.play(ex2["chips"].animate.set_opacity(1.0))
         self.wait(1.5)
+        log_text_cache_stats(type(self).__name__)
+
+
+class AttentionCloudVisualization(AttentionBankVisualization):
+    """
+    The "bank shifts in context" idea for a whole passage: every token's
+    vector is one point of a VectorCloud (the "bank" tokens also as arrows),
+    and all of them move together, layer by layer, as attention mixes
+    context in. The 2D positions are the states' top two principal axes.
+    """
+
+    passage = (
+        "He sat on the river bank and watched the water while she walked to the bank "
+        "to deposit cash before the bank closed and the boats drifted past the muddy bank"
+    )
+    repeats = 12
+    # Tokens also drawn as arrows from the origin
+    highlight = "bank"
+    n_layers = 3
+    d_model = 32
+
+    def construct(self):
+        axes = self.setup_axes()
+
+        tokens = self.passage.split() * self.repeats
+        x = token_embeddings(tokens, self.d_model) + pe_matrix(len(tokens), self.d_model)
+        _, states = attention_layers(x, self.n_layers, n_heads=4)
+        paths = project_2d(states, extent=(5.5, 3.2))
+
+        cloud = VectorCloud(
+            axes,
+            paths[0],
+            colors=color_gradient([BLUE, TEAL, GREEN], len(tokens)),
+            arrows=[i for i, t in enumerate(tokens) if t == self.highlight],
+            arrow_color=YELLOW,
+        )
+        title = self.attention_bubble(
+            f"{len(tokens)} tokens", ["layer 0: token + position"], width=4.2
+        ).to_corner(UL, buff=0.25)
+
+        layer = ValueTracker(0.0)
+
+        def blended():
+            t = layer.get_value()
+            lo = min(int(t), self.n_layers - 1)
+            f = t - lo
+            return paths[lo] * (1 - f) + paths[lo + 1] * f
+
+        # PMobject has no fade(); bring the dots in from the background color
+        cloud.dots.save_state()
+        cloud.dots.fade_to(BLACK, 1.0)
+        self.add(cloud)
+        intro = [FadeIn(title), Restore(cloud.dots)]
+        # No arrows when the passage doesn't contain the highlighted token
+        if cloud.arrows is not None:
+            intro.append(Create(cloud.arrows, lag_ratio=0))
+        self.play(*intro)
+        cloud.follow(blended)
+        self.wait(0.5)
+
+        for target in range(1, self.n_layers + 1):
+            self.play(
+                layer.animate.set_value(target),
+                title.set_lines([f"layer {target}: + attention"]),
+                run_time=2,
+            )
+            self.wait(0.5)
+
+        cloud.clear_updaters()
+        self.wait(1.5)
+        log_text_cache_stats(type(self).__name__)
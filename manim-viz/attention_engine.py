@@ -0,0 +1,142 @@
+"""
+Scaled dot-product self-attention in NumPy.
+
+self_attention computes Q, K, V, the scaled scores, the softmax weights
+and the outputs for every query at once, as a handful of matrix products
+on float32 arrays, so a few thousand tokens take milliseconds. Scenes read
+their numbers from the result instead of showing placeholders.
+
+toy_model gives reproducible embeddings and projections for a token list:
+each token's embedding is seeded from the token itself, so a word has the
+same vector in every sentence.
+"""
+
+import zlib
+
+import numpy as np
+
+
+def softmax(x, axis=-1):
+    """Numerically stable softmax along axis (the row maximum is subtracted first)."""
+    x = np.asarray(x, dtype=np.float32)
+    e = x - x.max(axis=axis, keepdims=True)
+    np.exp(e, out=e)
+    e *= 1 / e.sum(axis=axis, keepdims=True)
+    return e
+
+
+def toy_model(tokens, d_model=16, d_head=8, seed=0):
+    """
+    (embeddings (n, d_model), w_q, w_k, w_v (d_model, d_head)) for tokens.
+    Projections are scaled so scores come out roughly unit variance.
+    """
+    return (token_embeddings(tokens, d_model), *projections(d_model, d_head, seed))
+
+
+def token_embeddings(tokens, d_model=16):
+    """(n, d_model) embeddings, each seeded from its token."""
+    return np.stack([
+        np.random.default_rng(zlib.crc32(t.encode("utf-8"))).standard_normal(d_model)
+        for t in tokens
+    ]).astype(np.float32)
+
+
+def projections(d_model, d_head, seed=0):
+    """Random (w_q, w_k, w_v), each (d_model, d_head)."""
+    rng = np.random.default_rng(seed)
+    scale = 1 / np.sqrt(d_model)
+    return tuple(
+        (rng.standard_normal((d_model, d_head)) * scale).astype(np.float32) for _ in range(3)
+    )
+
+
+def self_attention(x, w_q, w_k, w_v, causal=False):
+    """
+    Attention of every token over every token. x is (n, d_model); returns a
+    dict of q, k, v (n, d_head), scores and weights (n queries x n keys)
+    and output (n, d_head). With causal, token i only sees tokens <= i.
+    """
+    x = np.asarray(x, dtype=np.float32)
+    # One product for all three projections
+    qkv = x @ np.concatenate([w_q, w_k, w_v], axis=1).astype(np.float32)
+    d_head = w_q.shape[1]
+    q, k, v = qkv[:, :d_head], qkv[:, d_head:2 * d_head], qkv[:, 2 * d_head:]
+
+    # Scale the (n, d_head) queries rather than the (n, n) scores
+    scores = (q * np.float32(1 / np.sqrt(d_head))) @ k.T
+    if causal:
+        positions = np.arange(len(x))
+        scores[positions[:, None] < positions] = -np.inf
+    weights = softmax(scores, axis=1)
+
+    return {
+        "q": q,
+        "k": k,
+        "v": v,
+        "scores": scores,
+        "weights": weights,
+        "output": weights @ v,
+    }
+
+
+def attend(tokens, query=None, **model_kwargs):
+    """
+    Run toy_model + self_attention on tokens. Returns the result dict plus
+    "tokens" and, for a query token (name or index), its "query" index.
+    """
+    tokens = list(tokens)
+    result = self_attention(*toy_model(tokens, **model_kwargs))
+    result["tokens"] = tokens
+    if query is not None:
+        result["query"] = tokens.index(query) if isinstance(query, str) else query % len(tokens)
+    return result
+
+
+def attention_layers(x, n_layers=4, n_heads=4, causal=True, seed=0):
+    """
+    Run a toy multi-head stack over x (n, d_model). Each layer adds its
+    concatenated head outputs to x (residual) and normalizes every row, so
+    later layers attend over mixed representations. Returns the weights
+    (n_layers, n_heads, n, n) and the token states before and after every
+    layer (n_layers + 1, n, d_model).
+    """
+    x = np.asarray(x, dtype=np.float32)
+    n, d_model = x.shape
+    if d_model % n_heads:
+        raise ValueError(f"d_model ({d_model}) must be a multiple of n_heads ({n_heads})")
+    d_head = d_model // n_heads
+    maps = np.empty((n_layers, n_heads, n, n), dtype=np.float32)
+    states = np.empty((n_layers + 1, n, d_model), dtype=np.float32)
+    states[0] = x
+    for layer in range(n_layers):
+        outputs = []
+        for head in range(n_heads):
+            result = self_attention(
+                x, *projections(d_model, d_head, seed + layer * n_heads + head), causal=causal
+            )
+            maps[layer, head] = result["weights"]
+            outputs.append(result["output"])
+        x = x + np.concatenate(outputs, axis=1)
+        x = (x - x.mean(axis=1, keepdims=True)) / (x.std(axis=1, keepdims=True) + 1e-6)
+        states[layer + 1] = x
+    return maps, states
+
+
+def layer_attention_maps(x, n_layers=4, n_heads=4, causal=True, seed=0):
+    """Just the (n_layers, n_heads, n, n) weights of attention_layers."""
+    return attention_layers(x, n_layers, n_heads, causal, seed)[0]
+
+
+def project_2d(states, extent=(1.0, 1.0)):
+    """
+    (..., n, d) states -> (..., n, 2) on their top two principal axes,
+    computed over all of them together so the views are comparable, and
+    scaled so the farthest point reaches extent on each axis.
+    """
+    states = np.asarray(states, dtype=np.float32)
+    flat = states.reshape(-1, states.shape[-1])
+    mean = flat.mean(axis=0)
+    _, _, vt = np.linalg.svd(flat - mean, full_matrices=False)
+    xy = (states - mean) @ vt[:2].T
+    reach = np.abs(xy.reshape(-1, 2)).max(axis=0)
+    return xy * (np.asarray(extent, dtype=np.float32) / np.maximum(reach, 1e-6))
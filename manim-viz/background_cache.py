@@ -0,0 +1,73 @@
+"""
+Drop-in Scene base class that rasterizes a static background once.
+
+manim already draws only the moving mobjects on every frame: before each
+play the static ones are rasterized into a frame that is copied under each
+new frame. That static frame is rebuilt from scratch for every play and
+wait, so a NumberPlane and its Axes are drawn again dozens of times per
+scene.
+
+Subclass BackgroundCacheScene instead of Scene and add the grid with
+self.add_background(...). The background is rasterized once and reused as
+the base of every play's static frame; only the other static mobjects are
+drawn on top of it. A play that animates or removes a background mobject
+falls back to manim's normal path. Call refresh_background() after changing
+a background mobject outside an animation.
+"""
+
+from manim import Scene
+from manim.utils.family import extract_mobject_family_members
+
+
+class BackgroundCacheScene(Scene):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.background_mobjects = []
+        self._background = None
+        # Plays whose static frame started from the cached background
+        self.background_hits = 0
+
+        save_static_frame_data = self.renderer.save_static_frame_data
+
+        def cached_save_static_frame_data(scene, static_mobjects):
+            return self._save_static_frame_data(save_static_frame_data, static_mobjects)
+
+        self.renderer.save_static_frame_data = cached_save_static_frame_data
+
+    def add_background(self, *mobjects):
+        """Add mobjects behind everything else, as the cached background."""
+        self.background_mobjects.extend(mobjects)
+        self.bring_to_back(*self.background_mobjects)
+        self._background = None
+        return self
+
+    def refresh_background(self):
+        """Rasterize the background again before the next play."""
+        self._background = None
+
+    def _save_static_frame_data(self, save_static_frame_data, static_mobjects):
+        renderer = self.renderer
+        family = extract_mobject_family_members(
+            self.background_mobjects,
+            use_z_index=renderer.camera.use_z_index,
+            only_those_with_points=True,
+        )
+        static = list(static_mobjects or [])
+        # The background must be static and at the bottom of this play's static layer
+        if not family or len(static) < len(family) or any(
+            a is not b for a, b in zip(static, family)
+        ):
+            return save_static_frame_data(self, static_mobjects)
+
+        if self._background is None:
+            renderer.static_image = None
+            renderer.update_frame(self, mobjects=family)
+            self._background = renderer.get_frame()
+
+        renderer.static_image = self._background
+        rest = static[len(family):]
+        if rest:
+            renderer.update_frame(self, mobjects=rest)
+            renderer.static_image = renderer.get_frame()
+        self.background_hits += 1
+        return renderer.static_image
@@ -0,0 +1,234 @@
+"""
+End-to-end render benchmarks with a local history.
+
+Each scene is rendered in a fresh process at fixed low and high quality.
+Recorded per run: total wall time, construct time (excluding play), total
+play time, encode time, frames written, mobject family size and peak RSS.
+Scenes render through the same HoldFrameFileWriter as render.py. Encoding
+runs on the writer thread alongside play, so encode_s is the time that
+thread spent in the encoder (overlapping play_s, not part of it).
+Rows are appended to benchmarks/history.csv and compared against the
+median of earlier runs; anything slower than --threshold is flagged.
+
+Run with: python benchmark.py                                    (all scenes)
+          python benchmark.py PositionalEncodingWavesToHeatmap   (one scene)
+          python benchmark.py --report                           (compare only)
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from statistics import median
+import argparse
+import csv
+import multiprocessing
+import resource
+import subprocess
+import sys
+import time
+
+from render import HERE, MEDIA, discover_scenes, load_scene_class, new_scene
+
+HISTORY = HERE / "benchmarks" / "history.csv"
+QUALITIES = {"low": "low_quality", "high": "high_quality"}
+FIELDS = [
+    "timestamp", "revision", "scene", "quality",
+    "total_s", "construct_s", "play_s", "encode_s",
+    "frames", "family_size", "peak_rss_mb",
+]
+# Metrics where larger is worse, compared against history
+COMPARED = ["total_s", "construct_s", "play_s", "encode_s", "peak_rss_mb"]
+
+
+def _timed(fn, bucket, key):
+    """Wrap fn so its wall time accumulates into bucket[key]."""
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            bucket[key] += time.perf_counter() - start
+    return wrapper
+
+
+def measure(path, scene_name, quality):
+    """
+    Worker: render one scene with timers around construct, play and the
+    file writer's encoding steps. Returns one history row (without
+    timestamp/revision).
+    """
+    from manim import tempconfig
+
+    scene_cls = load_scene_class(path, scene_name)
+    times = {"construct": 0.0, "play": 0.0, "encode": 0.0}
+    counts = {"frames": 0, "family": 0}
+
+    cfg = {
+        "quality": quality,
+        "media_dir": str(MEDIA / "benchmarks"),
+        "input_file": str(path),
+        "output_file": scene_name,
+        "format": "mp4",
+        "write_to_movie": True,
+        "disable_caching": True,
+        "preview": False,
+        "progress_bar": "none",
+    }
+    start = time.perf_counter()
+    with tempconfig(cfg):
+        scene = new_scene(scene_cls, cfg["format"])
+        writer = scene.renderer.file_writer
+
+        def count_frames(write_frame):
+            def wrapper(frame, num_frames=1):
+                counts["frames"] += num_frames
+                return write_frame(frame, num_frames)
+            return wrapper
+
+        def track_family(play):
+            def wrapper(*args, **kwargs):
+                result = play(*args, **kwargs)
+                size = sum(len(m.get_family()) for m in scene.mobjects)
+                counts["family"] = max(counts["family"], size)
+                return result
+            return wrapper
+
+        scene.construct = _timed(scene.construct, times, "construct")
+        scene.play = track_family(_timed(scene.play, times, "play"))
+        writer.write_frame = count_frames(writer.write_frame)
+        # HoldFrameFileWriter._encode is only called from the writer thread
+        writer._encode = _timed(writer._encode, times, "encode")
+
+        scene.render()
+    total = time.perf_counter() - start
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss /= 2**20 if sys.platform == "darwin" else 2**10
+    return {
+        "scene": scene_name,
+        "quality": quality,
+        "total_s": round(total, 3),
+        "construct_s": round(times["construct"] - times["play"], 3),
+        "play_s": round(times["play"], 3),
+        "encode_s": round(times["encode"], 3),
+        "frames": counts["frames"],
+        "family_size": counts["family"],
+        "peak_rss_mb": round(peak_rss, 1),
+    }
+
+
+def git_revision():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=HERE, capture_output=True, text=True, check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def load_history():
+    if not HISTORY.exists():
+        return []
+    with HISTORY.open(newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def append_history(rows):
+    HISTORY.parent.mkdir(parents=True, exist_ok=True)
+    new_file = not HISTORY.exists()
+    with HISTORY.open("a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        if new_file:
+            writer.writeheader()
+        writer.writerows(rows)
+
+
+def compare(rows, history, threshold=0.10, window=5):
+    """
+    Compare each row to the median of the previous `window` runs of the same
+    scene and quality. Returns a list of (row, metric, baseline, value) regressions.
+    """
+    regressions = []
+    for row in rows:
+        previous = [
+            h for h in history
+            if h["scene"] == row["scene"] and h["quality"] == row["quality"]
+            and h["timestamp"] != row["timestamp"]
+        ][-window:]
+        if not previous:
+            continue
+        for metric in COMPARED:
+            baseline = median(float(h[metric]) for h in previous)
+            value = float(row[metric])
+            if baseline > 0 and value > baseline * (1 + threshold):
+                regressions.append((row, metric, baseline, value))
+    return regressions
+
+
+def print_report(rows, regressions, threshold):
+    print(f"{'scene':<34} {'q':<4} {'total':>7} {'build':>7} {'play':>7} {'encode':>7} {'frames':>7} {'mobs':>7} {'rss MB':>7}")
+    for r in rows:
+        q = "low" if r["quality"] == QUALITIES["low"] else "high"
+        print(
+            f"{r['scene']:<34} {q:<4} {float(r['total_s']):7.2f} {float(r['construct_s']):7.2f} "
+            f"{float(r['play_s']):7.2f} {float(r['encode_s']):7.2f} {int(r['frames']):7d} "
+            f"{int(r['family_size']):7d} {float(r['peak_rss_mb']):7.1f}"
+        )
+    if regressions:
+        print(f"\nRegressions (> {threshold:.0%} over median of previous runs):")
+        for row, metric, baseline, value in regressions:
+            print(f"  {row['scene']} [{row['quality']}] {metric}: {baseline:.2f} -> {value:.2f}")
+    else:
+        print("\nNo regressions.")
+
+
+def run(scene_names=None, qualities=("low", "high")):
+    scenes = discover_scenes()
+    if scene_names:
+        missing = [s for s in scene_names if s not in scenes]
+        if missing:
+            raise SystemExit(f"Unknown scene(s): {', '.join(missing)}")
+        scenes = {s: scenes[s] for s in scene_names}
+
+    stamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    revision = git_revision()
+    rows = []
+    # One fresh process per measurement so RSS and caches don't carry over;
+    # runs are sequential to keep the timings comparable.
+    ctx = multiprocessing.get_context("spawn")
+    for name, path in scenes.items():
+        for q in qualities:
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                row = pool.submit(measure, path, name, QUALITIES[q]).result()
+            row.update(timestamp=stamp, revision=revision)
+            rows.append(row)
+            print(f"  {name} [{q}] {row['total_s']:.2f}s")
+    append_history(rows)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: all)")
+    parser.add_argument("--quality", nargs="+", choices=list(QUALITIES), default=["low", "high"])
+    parser.add_argument("--threshold", type=float, default=0.10, help="regression threshold (0.10 = 10%%)")
+    parser.add_argument("--report", action="store_true", help="only compare the latest recorded run")
+    args = parser.parse_args()
+
+    if args.report:
+        history = load_history()
+        if not history:
+            raise SystemExit(f"No history at {HISTORY}")
+        latest = history[-1]["timestamp"]
+        rows = [h for h in history if h["timestamp"] == latest]
+    else:
+        rows = run(args.scenes, args.quality)
+        history = load_history()
+
+    print_report(rows, compare(rows, history, args.threshold), args.threshold)
+
+
+if __name__ == "__main__":
+    main()
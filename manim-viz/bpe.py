@@ -0,0 +1,314 @@
+"""
+Byte-level BPE tokenizer (GPT-2 style vocab.json + merges.txt).
+
+Text is split into words with the GPT-2 pre-tokenization pattern, each word
+is turned into its UTF-8 bytes (one printable character per byte) and the
+merges are applied lowest rank first. A merge is one pop from a heap of
+(rank, position) pairs over a linked list of symbols, so a word costs
+O(n log n) instead of rescanning every pair after every merge. Words are
+cached, so repeated words cost one dict lookup.
+
+The GPT-2 files can be dropped into data/bpe/, or a small vocabulary can
+be trained on the blog posts in content/posts with --train. load() only
+reads; it never trains (TokenizationFlow trains in memory when the files
+are missing).
+
+Run with: python bpe.py --train                 (train on content/posts into data/bpe/)
+          python bpe.py "I love transformers"   (show the tokens)
+          python bpe.py --benchmark             (throughput over content/posts)
+"""
+
+from collections import Counter, defaultdict
+from pathlib import Path
+import argparse
+import heapq
+import json
+import re
+import time
+
+HERE = Path(__file__).resolve().parent
+POSTS = HERE.parent / "content" / "posts"
+DATA = HERE / "data" / "bpe"
+
+# GPT-2's pattern, with the \p{L} / \p{N} classes spelled for the re module
+# (\w includes _ and digits, so they are excluded or added back by hand)
+PATTERN = re.compile(r"""'s|'t|'re|'ve|'m|'ll|'d| ?[^\W\d_]+| ?\d+| ?(?:[^\s\w]|_)+|\s+(?!\S)|\s+""")
+
+
+def bytes_to_unicode():
+    """GPT-2's byte -> printable character table (spaces become 'Ġ' etc.)."""
+    bs = list(range(ord("!"), ord("~") + 1)) + list(range(ord("¡"), ord("¬") + 1)) \
+        + list(range(ord("®"), ord("ÿ") + 1))
+    cs = bs[:]
+    n = 0
+    for b in range(256):
+        if b not in bs:
+            bs.append(b)
+            cs.append(256 + n)
+            n += 1
+    return dict(zip(bs, map(chr, cs)))
+
+
+BYTE_ENCODER = bytes_to_unicode()
+BYTE_DECODER = {c: b for b, c in BYTE_ENCODER.items()}
+
+
+def _units(piece):
+    return "".join(BYTE_ENCODER[b] for b in piece.encode("utf-8"))
+
+
+class BPETokenizer:
+    def __init__(self, vocab, merges):
+        self.encoder = vocab
+        self.decoder = {i: token for token, i in vocab.items()}
+        self.ranks = {pair: rank for rank, pair in enumerate(merges)}
+        self.cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_files(cls, vocab_path, merges_path):
+        vocab = json.loads(Path(vocab_path).read_text(encoding="utf-8"))
+        lines = Path(merges_path).read_text(encoding="utf-8").splitlines()
+        merges = [tuple(line.split()) for line in lines if line and not line.startswith("#version")]
+        return cls(vocab, merges)
+
+    def save(self, directory):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        merges = sorted(self.ranks, key=self.ranks.get)
+        (directory / "vocab.json").write_text(json.dumps(self.encoder, ensure_ascii=False), encoding="utf-8")
+        (directory / "merges.txt").write_text(
+            "#version: 0.2\n" + "".join(f"{a} {b}\n" for a, b in merges), encoding="utf-8",
+        )
+
+    def bpe(self, word):
+        """Split a word (byte characters) into its tokens."""
+        ranks = self.ranks
+        symbols = list(word)
+        n = len(symbols)
+        if n < 2:
+            return symbols
+        # Doubly linked list over symbols; merged-away slots become None
+        nxt = list(range(1, n + 1))
+        prv = list(range(-1, n - 1))
+        heap = []
+        for i in range(n - 1):
+            rank = ranks.get((symbols[i], symbols[i + 1]))
+            if rank is not None:
+                heap.append((rank, i))
+        heapq.heapify(heap)
+
+        while heap:
+            rank, i = heapq.heappop(heap)
+            j = nxt[i]
+            # Skip entries made stale by an earlier merge
+            if symbols[i] is None or j >= n or ranks.get((symbols[i], symbols[j])) != rank:
+                continue
+            symbols[i] += symbols[j]
+            symbols[j] = None
+            nxt[i] = nxt[j]
+            if nxt[i] < n:
+                prv[nxt[i]] = i
+            p = prv[i]
+            if p >= 0:
+                rank = ranks.get((symbols[p], symbols[i]))
+                if rank is not None:
+                    heapq.heappush(heap, (rank, p))
+            k = nxt[i]
+            if k < n:
+                rank = ranks.get((symbols[i], symbols[k]))
+                if rank is not None:
+                    heapq.heappush(heap, (rank, i))
+        return [s for s in symbols if s is not None]
+
+    def encode_piece(self, piece):
+        """Token ids of one pre-tokenized piece, cached."""
+        ids = self.cache.get(piece)
+        if ids is not None:
+            self.hits += 1
+            return ids
+        self.misses += 1
+        ids = [self.encoder[token] for token in self.bpe(_units(piece))]
+        self.cache[piece] = ids
+        return ids
+
+    def encode(self, text):
+        ids = []
+        for piece in PATTERN.findall(text):
+            ids.extend(self.encode_piece(piece))
+        return ids
+
+    def tokens(self, text):
+        """[(token text, id)] for text, e.g. [("I", 40), (" love", 1842), ...]."""
+        return [(self.token_text(i), i) for i in self.encode(text)]
+
+    def token_text(self, token_id):
+        return self.decode([token_id])
+
+    def token_label(self, token_id):
+        """
+        Display form of one token: spaces as "␣", newlines as "↵", and a
+        token that is only part of a UTF-8 character as its bytes ("<0xE2>").
+        """
+        data = bytes(BYTE_DECODER[c] for c in self.decoder[token_id])
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            return "".join(f"<0x{b:02X}>" for b in data)
+        return text.replace(" ", "␣").replace("\n", "↵")
+
+    def decode(self, ids):
+        data = bytes(BYTE_DECODER[c] for i in ids for c in self.decoder[i])
+        return data.decode("utf-8", errors="replace")
+
+
+def train(texts, vocab_size=4000, min_count=2):
+    """
+    BPE tokenizer learned from texts: start from the 256 bytes and keep
+    merging the most frequent adjacent pair. Pair counts are updated only
+    for the words a merge touches, and the next pair comes off a heap.
+    """
+    counts = Counter(piece for text in texts for piece in PATTERN.findall(text))
+    words = [list(_units(piece)) for piece in counts]
+    freqs = list(counts.values())
+
+    pair_counts = Counter()
+    where = defaultdict(set)
+    for wi, word in enumerate(words):
+        for pair in zip(word, word[1:]):
+            pair_counts[pair] += freqs[wi]
+            where[pair].add(wi)
+    heap = [(-count, pair) for pair, count in pair_counts.items()]
+    heapq.heapify(heap)
+
+    vocab = {c: i for i, c in enumerate(BYTE_ENCODER.values())}
+    merges = []
+    while len(vocab) < vocab_size and heap:
+        count, pair = heapq.heappop(heap)
+        # Stale entry: the count changed after it was pushed
+        if pair_counts.get(pair, 0) != -count:
+            continue
+        if -count < min_count:
+            break
+        merges.append(pair)
+        merged = pair[0] + pair[1]
+        if merged not in vocab:
+            vocab[merged] = len(vocab)
+
+        touched = set()
+        for wi in where.pop(pair):
+            word, f = words[wi], freqs[wi]
+            if len(word) < 2:
+                continue
+            for p in zip(word, word[1:]):
+                pair_counts[p] -= f
+                touched.add(p)
+            out = []
+            i = 0
+            while i < len(word):
+                if i + 1 < len(word) and (word[i], word[i + 1]) == pair:
+                    out.append(merged)
+                    i += 2
+                else:
+                    out.append(word[i])
+                    i += 1
+            words[wi] = out
+            for p in zip(out, out[1:]):
+                pair_counts[p] += f
+                where[p].add(wi)
+                touched.add(p)
+        for p in touched:
+            if pair_counts[p] > 0:
+                heapq.heappush(heap, (-pair_counts[p], p))
+            else:
+                del pair_counts[p]
+    return BPETokenizer(vocab, merges)
+
+
+def corpus():
+    """Texts of the blog posts."""
+    return [path.read_text(encoding="utf-8") for path in sorted(POSTS.glob("*.md"))]
+
+
+def load(directory=DATA):
+    """Tokenizer from directory/vocab.json and merges.txt."""
+    directory = Path(directory)
+    vocab_path, merges_path = directory / "vocab.json", directory / "merges.txt"
+    if not vocab_path.exists() or not merges_path.exists():
+        raise FileNotFoundError(
+            f"No vocab.json + merges.txt in {directory}; copy GPT-2's there "
+            f"or run: python bpe.py --train"
+        )
+    return BPETokenizer.from_files(vocab_path, merges_path)
+
+
+def benchmark(tokenizer, texts, repeat=5):
+    """
+    Encode texts with an empty word cache, then `repeat` more times with it
+    warm. Returns {"bytes", "tokens", "cold_s", "warm_s", "hit_rate"}.
+    """
+    size = sum(len(text.encode("utf-8")) for text in texts)
+    tokenizer.cache.clear()
+    tokenizer.hits = tokenizer.misses = 0
+
+    start = time.perf_counter()
+    tokens = sum(len(tokenizer.encode(text)) for text in texts)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            tokenizer.encode(text)
+    warm = (time.perf_counter() - start) / repeat
+
+    lookups = tokenizer.hits + tokenizer.misses
+    return {
+        "bytes": size,
+        "tokens": tokens,
+        "cold_s": cold,
+        "warm_s": warm,
+        "hit_rate": tokenizer.hits / lookups if lookups else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("text", nargs="?", default="I love transformers")
+    parser.add_argument("--data", type=Path, default=DATA, help="directory with vocab.json + merges.txt")
+    parser.add_argument("--train", action="store_true", help="train on content/posts and save to --data")
+    parser.add_argument("--vocab-size", type=int, default=4000)
+    parser.add_argument("--benchmark", action="store_true", help="time encoding of content/posts")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.train:
+        start = time.perf_counter()
+        tokenizer = train(corpus(), args.vocab_size)
+        tokenizer.save(args.data)
+        print(f"Trained {len(tokenizer.encoder)} tokens on {POSTS} in {time.perf_counter() - start:.2f}s "
+              f"-> {args.data}")
+        return
+
+    start = time.perf_counter()
+    tokenizer = load(args.data)
+    print(f"Loaded {len(tokenizer.encoder)} tokens, {len(tokenizer.ranks)} merges "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    if not args.benchmark:
+        for token_id in tokenizer.encode(args.text):
+            print(f"    {tokenizer.token_label(token_id):<20} {token_id}")
+        return
+
+    texts = corpus()
+    result = benchmark(tokenizer, texts, args.repeat)
+    mb = result["bytes"] / 1e6
+    print(f"{len(texts)} posts, {result['bytes'] / 1e3:.0f} KB, {result['tokens']} tokens")
+    for label, seconds in (("cold", result["cold_s"]), ("warm", result["warm_s"])):
+        print(f"    {label}: {seconds * 1000:7.1f} ms  {mb / seconds:6.2f} MB/s  "
+              f"{result['tokens'] / seconds / 1e3:7.0f}k tokens/s")
+    print(f"    word cache hit rate: {result['hit_rate']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
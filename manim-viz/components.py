@@ -0,0 +1,168 @@
+"""
+Shared widgets: token chips, bracketed token arrays, labelled cells and a
+text panel whose lines can be swapped one at a time.
+
+Each shape is built once per process (per size) and stamped out with
+copy(); labels come from the Text cache. Stamping a chip costs a copy of
+a few dozen points instead of a fresh RoundedRectangle + Pango run.
+"""
+
+from functools import lru_cache
+
+from manim import (
+    VGroup, RoundedRectangle, Rectangle,
+    AnimationGroup, Restore, Wait,
+    WHITE, BLACK, BOLD, NORMAL,
+    LEFT, RIGHT,
+)
+
+from text_cache import cached_text
+
+
+@lru_cache(maxsize=None)
+def _rounded_box(width: float, height: float, corner_radius: float):
+    return RoundedRectangle(corner_radius=corner_radius, height=height, width=width)
+
+
+@lru_cache(maxsize=None)
+def _rect(width: float, height: float):
+    return Rectangle(width=width, height=height)
+
+
+def rounded_box(width, height, corner_radius=0.12, color=WHITE, stroke_width=2, fill_opacity=0.15):
+    """RoundedRectangle stroked and filled in one color."""
+    box = _rounded_box(round(width, 3), round(height, 3), corner_radius).copy()
+    return box.set_stroke(color, stroke_width).set_fill(color, opacity=fill_opacity)
+
+
+def make_token_chip(text, color=WHITE, width=0.9, height=0.7, font_size=28, corner_radius=0.12,
+                    fill_opacity=0.15, weight=NORMAL):
+    """Fixed-size rounded box with a centered label: VGroup(box, text)."""
+    box = rounded_box(width, height, corner_radius, color, fill_opacity=fill_opacity)
+    label = cached_text(str(text), font_size=font_size, color=color, weight=weight)
+    label.move_to(box.get_center())
+    return VGroup(box, label)
+
+
+def make_fitted_chip(text, color=WHITE, font_size=34, weight=BOLD, pad_w=0.7, pad_h=0.45,
+                     corner_radius=0.2, stroke_width=3, fill_opacity=0.08):
+    """Rounded box sized to its label: VGroup(box, text)."""
+    label = cached_text(text, font_size=font_size, color=color, weight=weight)
+    box = rounded_box(
+        label.width + pad_w, label.height + pad_h, corner_radius,
+        color, stroke_width=stroke_width, fill_opacity=fill_opacity,
+    )
+    label.move_to(box.get_center())
+    return VGroup(box, label)
+
+
+def make_token_array(values, color=WHITE, buff=0.15, bracket_size=40, **chip_kwargs):
+    """
+    Bracketed row of token chips: VGroup(left_bracket, chips, right_bracket).
+    """
+    chips = VGroup(*[make_token_chip(v, color, **chip_kwargs) for v in values])
+    chips.arrange(RIGHT, buff=buff)
+
+    left_bracket = cached_text("[", font_size=bracket_size, color=color)
+    right_bracket = cached_text("]", font_size=bracket_size, color=color)
+    left_bracket.next_to(chips, LEFT, buff=0.1)
+    right_bracket.next_to(chips, RIGHT, buff=0.1)
+    return VGroup(left_bracket, chips, right_bracket)
+
+
+def make_cell(label, color, width, height, font_size=10, label_color=BLACK, fill_opacity=0.8,
+              stroke_width=1):
+    """Filled rectangle with a small centered label, e.g. a q/k/v vector."""
+    rect = _rect(round(width, 3), round(height, 3)).copy()
+    rect.set_stroke(WHITE, stroke_width).set_fill(color, opacity=fill_opacity)
+    text = cached_text(label, font_size=font_size, color=label_color)
+    text.move_to(rect)
+    return VGroup(rect, text)
+
+
+class TextPanel(VGroup):
+    """
+    Rounded panel with a bold header and `n_lines` text slots. The panel is
+    sized once; set_lines only touches the slots whose text changed and
+    cross-fades them, so an update costs one cached Text per changed line
+    no matter how long the panel is.
+    """
+
+    def __init__(self, title, lines=(), n_lines=None, width=4.2, title_size=26, font_size=22,
+                 line_buff=0.18, header_buff=0.25, **kwargs):
+        super().__init__(**kwargs)
+        self.font_size = font_size
+        n_lines = max(n_lines or 0, len(lines))
+
+        header = cached_text(title, font_size=title_size, weight=BOLD)
+        # Slot height from a string with ascenders and descenders
+        slot = cached_text("Ag", font_size=font_size).height
+        content_height = header.height + header_buff + n_lines * slot + (n_lines - 1) * line_buff
+        panel = RoundedRectangle(corner_radius=0.25, width=width, height=content_height + 0.6)
+        panel.set_stroke(WHITE, 2)
+        panel.set_fill(BLACK, opacity=0.65)
+
+        # Left-center of each slot, relative to the panel center
+        left = -width / 2 + 0.3
+        top = content_height / 2
+        header.move_to([left, top - header.height / 2, 0], aligned_edge=LEFT)
+        first = top - header.height - header_buff - slot / 2
+        self._slots = [
+            [left, first - i * (slot + line_buff), 0] for i in range(n_lines)
+        ]
+
+        self.panel = panel
+        self.header = header
+        self.texts = [""] * n_lines
+        # One VGroup per slot, so a cross-fade can hold the old and new line
+        self.lines = VGroup(*[VGroup() for _ in self._slots])
+        self.add(panel, header, self.lines)
+        for i, text in enumerate(lines):
+            self._place(i, text)
+
+    def _place(self, i, text):
+        """Add `text` to slot i, returning the mobjects already there."""
+        slot = self.lines[i]
+        old = list(slot.submobjects)
+        if text:
+            new = cached_text(text, font_size=self.font_size)
+            new.move_to(self.panel.get_center() + self._slots[i], aligned_edge=LEFT)
+            slot.add(new)
+        self.texts[i] = text
+        return old
+
+    def set_lines(self, lines):
+        """
+        Swap in new line texts (missing lines become empty) and return the
+        cross-fade for the changed slots as one AnimationGroup, or a Wait
+        if nothing changed. Old lines fade out inside their slot and are
+        dropped from the panel when the animation finishes, so the panel
+        stays one mobject in the scene. Raises ValueError for more lines
+        than the panel has slots (size it with n_lines).
+        """
+        lines = list(lines)
+        if len(lines) > len(self.texts):
+            raise ValueError(f"{len(lines)} lines for a panel with {len(self.texts)} (pass a larger n_lines)")
+        lines = lines + [""] * (len(self.texts) - len(lines))
+        anims = []
+        faded = []
+        for i, text in enumerate(lines):
+            if text == self.texts[i]:
+                continue
+            old = self._place(i, text)
+            for mob in old:
+                anims.append(mob.animate.set_opacity(0))
+                faded.append((self.lines[i], mob))
+            if text:
+                new = self.lines[i][-1]
+                new.save_state()
+                new.set_opacity(0)
+                anims.append(Restore(new))
+        if not anims:
+            return Wait()
+
+        def drop_faded(scene):
+            for slot, mob in faded:
+                slot.remove(mob)
+
+        return AnimationGroup(*anims, group=self, _on_finish=drop_faded)
@@ -5,7 +5,6 @@ Run with: manim -pql --format gif embedding.py EmbeddingFlow
 
 from manim import (
     Scene,
-    Text,
     VGroup,
     RoundedRectangle,
     Arrow,
@@ -23,44 +22,29 @@ from manim import (
     WHITE,
 )
 
+from components import make_token_array
+from text_cache import cached_text, log_text_cache_stats
+
+
+# Colors
+TOKEN_COLOR = "#81c784"     # Green
+EMBED_COLOR = "#ffb74d"     # Orange
+ARROW_COLOR = "#90a4ae"     # Gray
+VEC_COLOR = "#64b5f6"       # Blue
+
 
 class EmbeddingFlow(Scene):
+    # Colors the direct GIF/WebP encoder builds its palette from
+    palette = [TOKEN_COLOR, EMBED_COLOR, ARROW_COLOR, VEC_COLOR, GRAY, WHITE]
+
     def construct(self):
-        # Colors
-        TOKEN_COLOR = "#81c784"     # Green
-        EMBED_COLOR = "#ffb74d"     # Orange
-        ARROW_COLOR = "#90a4ae"     # Gray
-        VEC_COLOR = "#64b5f6"       # Blue
-        
         # ============ STEP 1: Token IDs (continuing from previous) ============
         token_ids = [42, 891, 2048]
         
-        token_boxes = VGroup()
-        for tid in token_ids:
-            text = Text(str(tid), font_size=28, color=TOKEN_COLOR)
-            box = RoundedRectangle(
-                corner_radius=0.12,
-                height=0.7,
-                width=0.9,
-                stroke_color=TOKEN_COLOR,
-                stroke_width=2,
-                fill_color=TOKEN_COLOR,
-                fill_opacity=0.15
-            )
-            text.move_to(box.get_center())
-            token_boxes.add(VGroup(box, text))
-        
-        token_boxes.arrange(RIGHT, buff=0.15)
-        
-        left_bracket = Text("[", font_size=40, color=TOKEN_COLOR)
-        right_bracket = Text("]", font_size=40, color=TOKEN_COLOR)
-        left_bracket.next_to(token_boxes, LEFT, buff=0.1)
-        right_bracket.next_to(token_boxes, RIGHT, buff=0.1)
-        
-        token_array = VGroup(left_bracket, token_boxes, right_bracket)
+        token_array = make_token_array(token_ids, TOKEN_COLOR)
         token_array.to_edge(UP, buff=0.6)
         
-        token_label = Text("Token IDs", font_size=20, color=GRAY)
+        token_label = cached_text("Token IDs", font_size=20, color=GRAY)
         token_label.next_to(token_array, LEFT, buff=0.3)
         
         self.add(token_array, token_label)
@@ -76,7 +60,7 @@ class EmbeddingFlow(Scene):
             fill_color=EMBED_COLOR,
             fill_opacity=0.2
         )
-        embed_text = Text("Embedding Lookup Table", font_size=22, color=EMBED_COLOR)
+        embed_text = cached_text("Embedding Lookup Table", font_size=22, color=EMBED_COLOR)
         embed_text.move_to(embed_layer.get_center())
         embed_group = VGroup(embed_layer, embed_text)
         embed_group.next_to(token_array, DOWN, buff=0.8)
@@ -118,13 +102,13 @@ class EmbeddingFlow(Scene):
             dots = VGroup()
             values = ["0.2", "...", "-0.5"]
             for val in values:
-                dot_text = Text(val, font_size=14, color=WHITE)
+                dot_text = cached_text(val, font_size=14, color=WHITE)
                 dots.add(dot_text)
             dots.arrange(DOWN, buff=0.2)
             dots.move_to(vec_box.get_center())
             
             # Word label below
-            word_label = Text(f'"{word}"', font_size=16, color=GRAY)
+            word_label = cached_text(f'"{word}"', font_size=16, color=GRAY)
             word_label.next_to(vec_box, DOWN, buff=0.15)
             
             embed_vectors.add(VGroup(vec_box, dots, word_label))
@@ -141,7 +125,7 @@ class EmbeddingFlow(Scene):
             stroke_width=2
         )
         
-        dim_label = Text("d-dimensional vectors", font_size=18, color=GRAY)
+        dim_label = cached_text("d-dimensional vectors", font_size=18, color=GRAY)
         dim_label.next_to(embed_vectors, DOWN, buff=0.3)
         
         self.play(
@@ -154,3 +138,4 @@ class EmbeddingFlow(Scene):
         )
         self.play(Write(dim_label), run_time=0.4)
         self.wait(1.5)
+        log_text_cache_stats(type(self).__name__)
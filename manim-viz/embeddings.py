@@ -0,0 +1,202 @@
+"""
+Memory-mapped word embeddings and analogy search.
+
+A word2vec/GloVe text file (or a .npy matrix with a .vocab.txt next to it)
+is converted once into two files beside the source:
+
+  <stem>.f32.npy     unit-length float32 vectors, one row per word
+  <stem>.vocab.txt   the words, one per line, in row order
+
+load() memory-maps the matrix, so opening 400k x 300 vectors costs the
+vocabulary read and nothing else; pages are read from disk only when a
+search touches them. Rows are stored normalized, so cosine similarity
+against the whole vocabulary is one matrix-vector product, and the top k
+come from argpartition rather than a full sort.
+
+Run with: python embeddings.py ~/data/glove.6B.300d.txt    (convert + demo analogy)
+"""
+
+from pathlib import Path
+import argparse
+import os
+import time
+
+import numpy as np
+
+
+def converted_paths(source):
+    source = Path(source)
+    stem = source.with_suffix("") if source.suffix in (".txt", ".vec", ".npy") else source
+    return stem.with_name(stem.name + ".f32.npy"), stem.with_name(stem.name + ".vocab.txt")
+
+
+def _text_shape(path):
+    """(rows, dim, has_header) of a word2vec / GloVe text file."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        first = f.readline().split()
+        header = len(first) == 2 and all(p.isdigit() for p in first)
+        if header:
+            return int(first[0]), int(first[1]), True
+        dim = len(first) - 1
+        rows = 1 + sum(1 for _ in f)
+    return rows, dim, False
+
+
+def convert(source):
+    """
+    Write the normalized float32 matrix and vocabulary for source. Text files
+    are streamed row by row into the memory-mapped output, never held whole.
+    Both are written under .partial names and renamed into place at the end,
+    vocabulary first, so an interrupted run never leaves a matrix load()
+    would map. Returns (matrix path, vocab path).
+    """
+    source = Path(source)
+    matrix_path, vocab_path = converted_paths(source)
+    tmp_path = matrix_path.with_name(matrix_path.name + ".partial")
+
+    if source.suffix == ".npy":
+        vectors = np.load(source, mmap_mode="r")
+        src_vocab = source.with_name(source.stem + ".vocab.txt")
+        words = src_vocab.read_text(encoding="utf-8").splitlines()
+        out = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=vectors.shape)
+        for start in range(0, len(vectors), 65536):
+            block = np.asarray(vectors[start:start + 65536], dtype=np.float32)
+            norms = np.linalg.norm(block, axis=1, keepdims=True)
+            out[start:start + len(block)] = block / np.maximum(norms, 1e-12)
+    else:
+        rows, dim, header = _text_shape(source)
+        out = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=(rows, dim))
+        words = []
+        with open(source, encoding="utf-8", errors="replace") as f:
+            if header:
+                f.readline()
+            for line in f:
+                # The numbers are the last dim fields; some GloVe dumps have spaces in words
+                parts = line.rstrip().split(" ")
+                if len(parts) <= dim:
+                    continue
+                try:
+                    row = np.array(parts[-dim:], dtype=np.float32)
+                except ValueError:
+                    continue
+                word = " ".join(parts[:-dim])
+                out[len(words)] = row / max(float(np.linalg.norm(row)), 1e-12)
+                words.append(word)
+        if len(words) < rows:
+            # Copy into a file without the skipped rows' slots, block by block
+            trim_path = matrix_path.with_name(matrix_path.name + ".trim.partial")
+            trimmed = np.lib.format.open_memmap(trim_path, mode="w+", dtype=np.float32,
+                                                shape=(len(words), dim))
+            for start in range(0, len(words), 65536):
+                trimmed[start:start + 65536] = out[start:min(start + 65536, len(words))]
+            trimmed.flush()
+            del out, trimmed
+            os.replace(trim_path, tmp_path)
+            out = None
+
+    if out is not None:
+        out.flush()
+        del out
+    vocab_tmp = vocab_path.with_name(vocab_path.name + ".partial")
+    vocab_tmp.write_text("\n".join(words) + "\n", encoding="utf-8")
+    os.replace(vocab_tmp, vocab_path)
+    os.replace(tmp_path, matrix_path)
+    return matrix_path, vocab_path
+
+
+class Embeddings:
+    """Normalized vectors (memory-mapped) plus the word -> row index."""
+
+    def __init__(self, vectors, words):
+        self.vectors = vectors
+        self.words = words
+        self.index = {w: i for i, w in enumerate(words)}
+
+    def __contains__(self, word):
+        return word in self.index
+
+    def __len__(self):
+        return len(self.words)
+
+    def vector(self, word):
+        return np.asarray(self.vectors[self.index[word]])
+
+    def most_similar(self, query, k=5, exclude=()):
+        """[(word, cosine)] of the k rows closest to query, best first."""
+        query = np.asarray(query, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        scores = np.asarray(self.vectors @ query)
+        for word in exclude:
+            if word in self.index:
+                scores[self.index[word]] = -np.inf
+        k = min(k, len(scores))
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(scores[top])[::-1]]
+        return [(self.words[i], float(scores[i])) for i in top]
+
+    def analogy(self, a, b, c, k=5):
+        """Words closest to a - b + c (e.g. queen - woman + man), excluding a, b, c."""
+        target = self.vector(a) - self.vector(b) + self.vector(c)
+        return self.most_similar(target, k, exclude=(a, b, c))
+
+    def fit_pca(self, sample=10000, seed=0):
+        """
+        (mean, components (2, dim)) of a 2-D PCA fit on `sample` rows: the
+        first half most frequent words (files are frequency ordered), the rest
+        drawn at random.
+        """
+        n = len(self.vectors)
+        head = min(n, sample // 2)
+        rest = np.random.default_rng(seed).choice(np.arange(head, n), min(n - head, sample - head),
+                                                  replace=False) if n > head else np.array([], int)
+        rows = np.concatenate([np.arange(head), np.sort(rest)]).astype(int)
+        data = np.asarray(self.vectors[rows], dtype=np.float32)
+        mean = data.mean(axis=0)
+        _, _, vt = np.linalg.svd(data - mean, full_matrices=False)
+        return mean, vt[:2]
+
+    def project(self, words_or_vectors, pca):
+        """(n, 2) PCA coordinates of words (or raw vectors)."""
+        mean, components = pca
+        vectors = np.array([
+            self.vector(w) if isinstance(w, str) else np.asarray(w, dtype=np.float32)
+            for w in words_or_vectors
+        ])
+        return (vectors - mean) @ components.T
+
+
+def load(source):
+    """
+    Embeddings for source, converting it first if the converted files are
+    missing or older than it.
+    """
+    source = Path(source)
+    matrix_path, vocab_path = converted_paths(source)
+    if (not matrix_path.exists() or not vocab_path.exists()
+            or matrix_path.stat().st_mtime < source.stat().st_mtime):
+        convert(source)
+    vectors = np.load(matrix_path, mmap_mode="r")
+    words = vocab_path.read_text(encoding="utf-8").splitlines()
+    return Embeddings(vectors, words)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("source", type=Path, help="word2vec/GloVe .txt or .npy (+ .vocab.txt)")
+    parser.add_argument("--analogy", nargs=3, default=["queen", "woman", "man"], metavar=("A", "B", "C"))
+    parser.add_argument("-k", type=int, default=5)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    emb = load(args.source)
+    print(f"Loaded {len(emb)} x {emb.vectors.shape[1]} in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    a, b, c = args.analogy
+    for word, score in emb.analogy(a, b, c, k=args.k):
+        print(f"    {word:<20} {score:.3f}")
+    print(f"{a} - {b} + {c}: searched in {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
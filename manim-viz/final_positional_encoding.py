@@ -1,12 +1,20 @@
 from manim import (
     Scene, VGroup, Square, Text, MathTex, SurroundingRectangle, Arrow,
-    FadeIn, FadeOut, Create, Axes,
+    FadeIn, FadeOut, Create,
     BLUE, GREEN, YELLOW, ORANGE, PURPLE, TEAL, RED, MAROON, WHITE, GRAY_B,
     UP, DOWN, LEFT, RIGHT
 )
-import numpy as np
+
+from tex_batch import precompile_tex
+from waveforms import make_waveform
+
+FREQ_COLORS = [BLUE, GREEN, YELLOW, ORANGE, PURPLE, TEAL, RED, MAROON]
+
 
 class PositionalEncodingVectorAdd(Scene):
+    # Colors the direct GIF/WebP encoder builds its palette from
+    palette = [*FREQ_COLORS, WHITE, GRAY_B]
+
     def construct(self):
         # ----------------------------
         # Config
@@ -16,7 +24,14 @@ class PositionalEncodingVectorAdd(Scene):
         box_size = 0.75
         box_buff = 0.12
 
-        freq_colors = [BLUE, GREEN, YELLOW, ORANGE, PURPLE, TEAL, RED, MAROON]
+        freq_colors = FREQ_COLORS
+
+        # Every MathTex below, compiled in a single LaTeX run
+        precompile_tex(math=[
+            *[fr"e_{{{i}}}" for i in range(d_model)],
+            *[fr"e_{{{i}}}+" for i in range(d_model)],
+            r"\sin", r"\cos", "+",
+        ])
 
         # ----------------------------
         # Helpers
@@ -36,52 +51,24 @@ class PositionalEncodingVectorAdd(Scene):
                 for i in range(len(boxes))
             ])
 
+        # One \sin / \cos label each, copied into every box
+        wave_labels = {
+            True: MathTex(r"\sin", font_size=18),
+            False: MathTex(r"\cos", font_size=18),
+        }
+
         def create_waveform(box, freq_idx, is_sin):
             """Create a small waveform graph inside a box showing sin/cos pattern"""
-            # Create a mini axes inside the box
-            wave_size = box_size * 0.5  # Make waveform smaller than box
-            axes = Axes(
-                x_range=[0, 2*np.pi, np.pi/2],
-                y_range=[-1.2, 1.2, 0.5],
-                x_length=wave_size,
-                y_length=wave_size,
-                axis_config={"color": freq_colors[freq_idx % len(freq_colors)], 
-                           "stroke_width": 1.5,
-                           "include_ticks": False,
-                           "include_numbers": False},
-                tips=False
-            )
-            axes.move_to(box.get_center())
-            
-            # Create the waveform with frequency based on freq_idx
-            # Higher freq_idx = higher frequency (more cycles)
-            freq = freq_idx + 1  # Linear frequency scaling (1, 2, 3, ...)
-            
-            def sin_wave_func(t):
-                return np.sin(freq * t)
-            
-            def cos_wave_func(t):
-                return np.cos(freq * t)
-            
-            if is_sin:
-                wave_func = sin_wave_func
-                label = MathTex(r"\sin", font_size=18, color=freq_colors[freq_idx % len(freq_colors)])
-            else:
-                wave_func = cos_wave_func
-                label = MathTex(r"\cos", font_size=18, color=freq_colors[freq_idx % len(freq_colors)])
-            
-            # Create parametric function for the wave
-            wave = axes.plot(
-                wave_func,
-                x_range=[0, 2*np.pi],
-                color=freq_colors[freq_idx % len(freq_colors)],
-                stroke_width=2.5
-            )
-            
+            c = freq_colors[freq_idx % len(freq_colors)]
+            # Higher freq_idx = higher frequency (more cycles): 1, 2, 3, ...
+            glyph = make_waveform(freq_idx + 1, is_sin, box_size * 0.5, color=c)
+            glyph.move_to(box.get_center())
+
             # Position label at top of box
+            label = wave_labels[is_sin].copy().set_color(c)
             label.move_to(box.get_top() + 0.15 * DOWN)
-            
-            return VGroup(axes, wave, label)
+
+            return VGroup(*glyph, label)
 
         def pe_labels(boxes):
             inner = VGroup()
@@ -106,44 +93,12 @@ class PositionalEncodingVectorAdd(Scene):
                 c = freq_colors[freq % len(freq_colors)]
                 is_sin = (i % 2 == 0)
                 
-                # Create a smaller waveform (just the wave, no axes or label)
-                wave_size = box_size * 0.35
-                axes = Axes(
-                    x_range=[0, 2*np.pi, np.pi/2],
-                    y_range=[-1.2, 1.2, 0.5],
-                    x_length=wave_size,
-                    y_length=wave_size,
-                    axis_config={"color": c, 
-                               "stroke_width": 1,
-                               "include_ticks": False,
-                               "include_numbers": False},
-                    tips=False
-                )
-                
-                # Position waveform in the right half of the box
-                axes.move_to(boxes[i].get_center() + 0.15 * RIGHT)
-                
-                # Create the waveform
-                freq_val = freq + 1
-                
-                def sin_wave_func(t):
-                    return np.sin(freq_val * t)
-                
-                def cos_wave_func(t):
-                    return np.cos(freq_val * t)
-                
-                if is_sin:
-                    wave_func = sin_wave_func
-                else:
-                    wave_func = cos_wave_func
-                
-                wave = axes.plot(
-                    wave_func,
-                    x_range=[0, 2*np.pi],
-                    color=c,
-                    stroke_width=2
-                )
-                
+                # Same cached glyph as the PE row, smaller and in the right half of the box
+                glyph = make_waveform(freq + 1, is_sin, box_size * 0.35, color=c,
+                                      wave_width=2, axis_width=1)
+                glyph.move_to(boxes[i].get_center() + 0.15 * RIGHT)
+                axes, wave = glyph
+
                 # Create "e_i +" label on the left
                 emb_label = MathTex(fr"e_{{{i}}}+", font_size=20, color=WHITE)
                 emb_label.move_to(boxes[i].get_center() + 0.2 * LEFT)
@@ -0,0 +1,181 @@
+"""
+Array-backed heatmap mobject.
+
+One ImageMobject holds the whole matrix, colored by a vectorized NumPy
+colormap, instead of one Square per cell. Columns can be hidden and
+revealed through the image's alpha channel (ColumnSweep), so a reveal
+costs one array write per frame however many columns it covers.
+
+The values can be replaced in place (set_values) or bound to a function
+that is read every frame (bind), which recolors the same image without
+building any mobject.
+"""
+
+from manim import Animation, ImageMobject, BLUE, WHITE, RED, UL, RIGHT, DOWN, interpolate_color
+from manim.constants import RESAMPLING_ALGORITHMS
+import numpy as np
+
+
+def value_to_color(v: float):
+    """
+    Map [-1, 1] -> color. BLUE (neg) -> WHITE (0) -> RED (pos).
+    """
+    # Normalize to [0,1]
+    t = (v + 1.0) / 2.0
+    if t < 0.5:
+        return interpolate_color(BLUE, WHITE, t / 0.5)
+    else:
+        return interpolate_color(WHITE, RED, (t - 0.5) / 0.5)
+
+
+def values_to_rgba(values: np.ndarray, low=BLUE, mid=WHITE, high=RED) -> np.ndarray:
+    """
+    Vectorized version of value_to_color.
+    Maps an array of values in [-1, 1] to a uint8 RGBA array of shape values.shape + (4,).
+    """
+    t = np.clip((np.asarray(values, dtype=np.float32) + 1.0) / 2.0, 0.0, 1.0)[..., None]
+    low, mid, high = (np.asarray(c.to_rgb(), dtype=np.float32) for c in (low, mid, high))
+
+    # Same piecewise-linear ramp as value_to_color, for every cell at once
+    lower = low + (mid - low) * (t / 0.5)
+    upper = mid + (high - mid) * ((t - 0.5) / 0.5)
+    rgb = np.where(t < 0.5, lower, upper)
+
+    rgba = np.empty(rgb.shape[:-1] + (4,), dtype=np.uint8)
+    rgba[..., :3] = np.rint(rgb * 255)
+    rgba[..., 3] = 255
+    return rgba
+
+
+class Heatmap(ImageMobject):
+    """
+    Heatmap of a 2D array (rows=pos, cols=dim) drawn as a single image.
+
+    Each cell maps to one pixel and is upscaled with nearest-neighbour sampling,
+    so cells stay crisp. Column and row slices are returned as separate image
+    mobjects placed exactly over their region of the heatmap.
+
+    value_range is mapped onto the (low, mid, high) colors; the default is
+    value_to_color's [-1, 1] on BLUE / WHITE / RED.
+    """
+
+    def __init__(self, values: np.ndarray, cell_size=0.10, value_range=(-1.0, 1.0),
+                 colors=(BLUE, WHITE, RED), **kwargs):
+        self.values = np.asarray(values)
+        self.n_rows, self.n_cols = self.values.shape
+        self.cell_size = cell_size
+        self.value_range = value_range
+        self.colors = colors
+        self.rgba = self._to_rgba(self.values)
+        # Per-column opacity, multiplied into the image's alpha channel
+        self.column_alpha = np.ones(self.n_cols, dtype=np.float32)
+        super().__init__(
+            self.rgba,
+            resampling_algorithm=RESAMPLING_ALGORITHMS["nearest"],
+            **kwargs,
+        )
+        self.stretch_to_fit_width(self.n_cols * cell_size)
+        self.stretch_to_fit_height(self.n_rows * cell_size)
+        self.move_to([0.0, 0.0, 0.0])
+
+    def _to_rgba(self, values):
+        lo, hi = self.value_range
+        if (lo, hi) != (-1.0, 1.0):
+            values = (np.asarray(values, dtype=np.float32) - lo) * (2.0 / (hi - lo)) - 1.0
+        return values_to_rgba(values, *self.colors)
+
+    def set_values(self, values: np.ndarray):
+        """Recolor the image in place from a new array of the same shape."""
+        values = np.asarray(values)
+        if values.shape != (self.n_rows, self.n_cols):
+            raise ValueError(f"Expected shape {(self.n_rows, self.n_cols)}, got {values.shape}")
+        self.values = values
+        self.rgba = self._to_rgba(values)
+        self.pixel_array[..., :3] = self.rgba[..., :3]
+        self._apply_column_alpha()
+        return self
+
+    def bind(self, source):
+        """
+        Keep the heatmap showing source() (a function returning an array)
+        with an updater; returns the updater so it can be removed.
+        """
+        def update(mob):
+            mob.set_values(source())
+
+        self.add_updater(update)
+        return update
+
+    def _cell_width(self):
+        return self.width / self.n_cols
+
+    def _cell_height(self):
+        return self.height / self.n_rows
+
+    def set_column_alpha(self, alpha, start: int = 0, stop: int = None):
+        """Set the opacity of columns [start, stop) (all by default)."""
+        self.column_alpha[start:stop] = alpha
+        self._apply_column_alpha()
+        return self
+
+    def _apply_column_alpha(self):
+        self.pixel_array[..., 3] = np.rint(self.rgba[..., 3] * self.column_alpha)
+
+    def _slice(self, rows: slice, cols: slice):
+        """
+        Build an image of the given sub-block, placed over the same cells.
+        """
+        r0, r1, _ = rows.indices(self.n_rows)
+        c0, c1, _ = cols.indices(self.n_cols)
+        part = ImageMobject(
+            self.rgba[r0:r1, c0:c1],
+            resampling_algorithm=RESAMPLING_ALGORITHMS["nearest"],
+        )
+        part.stretch_to_fit_width((c1 - c0) * self._cell_width())
+        part.stretch_to_fit_height((r1 - r0) * self._cell_height())
+        part.move_to(
+            self.get_corner(UL)
+            + RIGHT * (c0 + c1) / 2 * self._cell_width()
+            + DOWN * (r0 + r1) / 2 * self._cell_height()
+        )
+        return part
+
+    def get_columns(self, start: int, stop: int):
+        """Image of columns [start, stop) over all rows."""
+        return self._slice(slice(None), slice(start, stop))
+
+    def get_column(self, c: int):
+        return self.get_columns(c, c + 1)
+
+    def get_rows(self, start: int, stop: int):
+        """Image of rows [start, stop) over all columns."""
+        return self._slice(slice(start, stop), slice(None))
+
+    def get_row(self, r: int):
+        return self.get_rows(r, r + 1)
+
+
+class ColumnSweep(Animation):
+    """
+    Reveal heatmap columns [start, stop) as a left-to-right wipe.
+
+    Every frame rewrites the heatmap's alpha channel once, so the cost does
+    not depend on how many columns are swept. softness is the width of the
+    fading edge, in columns.
+    """
+
+    def __init__(self, heatmap: Heatmap, start: int, stop: int, softness=1.0, **kwargs):
+        self.col_start = start
+        self.col_stop = stop
+        self.softness = softness
+        super().__init__(heatmap, **kwargs)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        n = self.col_stop - self.col_start
+        # The edge travels past the last column so it ends fully opaque
+        front = self.rate_func(alpha) * (n + self.softness)
+        cols = np.arange(n, dtype=np.float32)
+        self.mobject.column_alpha[self.col_start:self.col_stop] = np.clip(
+            (front - cols) / self.softness, 0.0, 1.0
+        )
+        self.mobject._apply_column_alpha()
@@ -0,0 +1,73 @@
+"""
+Encode static holds once.
+
+manim already rasterizes a static self.wait once, but the file writer
+still converts and encodes that frame num_frames times. HoldFrameFileWriter
+collapses every run of identical frames (a wait, or an animation that
+happens to leave the picture unchanged) into two encoded frames: the
+first at the start of the run and a copy at its last timestamp. The
+copy is an all-skip P-frame of a few bytes. The pts jump between them
+makes the MP4 variable frame rate, and it plays back exactly like the
+full run of frames. B-frames are turned off: with them the encoder
+assigns dts as if frames were evenly spaced, the muxer takes the movie
+length from those, and holds get cut short.
+
+Use with: scene_cls(renderer=CairoRenderer(file_writer_class=HoldFrameFileWriter))
+"""
+
+from fractions import Fraction
+
+import av
+import numpy as np
+from manim.scene.scene_file_writer import SceneFileWriter
+
+
+class HoldFrameFileWriter(SceneFileWriter):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.frames_in = 0
+        self.frames_encoded = 0
+
+    def open_partial_movie_stream(self, file_path=None):
+        self._held = None
+        self._held_frames = 0
+        self._pts = 0
+        super().open_partial_movie_stream(file_path)
+        if self.video_stream.codec_context.name == "libx264":
+            self.video_stream.codec_context.options = {
+                **self.video_stream.codec_context.options, "bf": "0",
+            }
+
+    def listen_and_write(self):
+        super().listen_and_write()
+        # The queue is drained; encode the run still being held
+        self._flush_hold()
+
+    def encode_and_write_frame(self, frame, num_frames):
+        self.frames_in += num_frames
+        if self._held is not None and np.array_equal(self._held, frame):
+            self._held_frames += num_frames
+            return
+        self._flush_hold()
+        self._held = frame
+        self._held_frames = num_frames
+
+    def _flush_hold(self):
+        if self._held is None:
+            return
+        self._encode(self._held, self._pts)
+        if self._held_frames > 1:
+            self._encode(self._held, self._pts + self._held_frames - 1)
+        self._pts += self._held_frames
+        self._held = None
+        self._held_frames = 0
+
+    def _encode(self, frame, pts):
+        # A fresh VideoFrame per encode; the encoder must not see the same one twice
+        av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+        av_frame.pts = pts
+        # codec_context.time_base is only set once the encoder opens
+        av_frame.time_base = 1 / Fraction(self.video_stream.codec_context.framerate)
+        for packet in self.video_stream.encode(av_frame):
+            self.video_container.mux(packet)
+        self.frames_encoded += 1
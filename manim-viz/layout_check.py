@@ -0,0 +1,206 @@
+"""
+Check scene layouts without rendering.
+
+Runs each scene's construct with every animation fast-forwarded to its end
+state and the camera switched off, so no frame is ever rasterized. After
+every play the on-screen mobjects are inspected for:
+
+  - text or boxes that leave the frame,
+  - text overlapping other text,
+  - boxes overlapping other boxes (a box nested inside another is fine).
+
+The report lists each problem once, with the play where it first showed
+up, plus the final bounding boxes with --boxes.
+
+Run with: python layout_check.py                          (all scenes)
+          python layout_check.py SelfAttentionAnimation   (one scene)
+          python layout_check.py --boxes                  (also print bounding boxes)
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+import argparse
+import os
+import time
+
+import numpy as np
+
+from render import MEDIA, discover_scenes, load_scene_class
+
+# Overlaps smaller than this (scene units, per axis) are shared edges, not problems
+TOLERANCE = 0.02
+
+
+def describe(mob):
+    """Short, readable name for a mobject in the report."""
+    for attr in ("text", "tex_string"):
+        value = getattr(mob, attr, None)
+        if isinstance(value, str) and value:
+            label = value if len(value) <= 24 else value[:21] + "..."
+            return f"{type(mob).__name__}({label!r})"
+    return f"{type(mob).__name__}@({mob.get_x():.2f}, {mob.get_y():.2f})"
+
+
+def _visible(mob):
+    from manim import VMobject
+
+    family = [m for m in mob.get_family() if isinstance(m, VMobject) and m.has_points()]
+    if not family:
+        # Images and other non-vector mobjects carry no opacity we can read cheaply
+        return mob.has_points()
+    return any(m.get_fill_opacity() > 0 or m.get_stroke_opacity() > 0 for m in family)
+
+
+def collect(mobjects):
+    """
+    Split the scene into text-like and box-like leaves. Text is taken as a
+    whole (not per glyph); groups are searched recursively.
+    """
+    from manim import ImageMobject, MarkupText, Paragraph, Rectangle, SingleStringMathTex, Text
+
+    texts, boxes = [], []
+    todo = list(mobjects)
+    while todo:
+        mob = todo.pop()
+        if isinstance(mob, (Text, MarkupText, Paragraph, SingleStringMathTex)):
+            if _visible(mob):
+                texts.append(mob)
+            continue
+        if isinstance(mob, (Rectangle, ImageMobject)) and _visible(mob):
+            boxes.append(mob)
+        todo.extend(mob.submobjects)
+    return texts, boxes
+
+
+def bounds(mobs):
+    """(n, 2) arrays of lower-left and upper-right corners."""
+    if not mobs:
+        return np.zeros((0, 2)), np.zeros((0, 2))
+    lo = np.array([m.get_critical_point(np.array([-1, -1, 0]))[:2] for m in mobs])
+    hi = np.array([m.get_critical_point(np.array([1, 1, 0]))[:2] for m in mobs])
+    return lo, hi
+
+
+def overlapping_pairs(lo, hi, allow_nested=False):
+    """Index pairs (i < j) whose boxes overlap by more than TOLERANCE on both axes."""
+    overlap = np.minimum(hi[:, None], hi[None]) - np.maximum(lo[:, None], lo[None])
+    hit = (overlap > TOLERANCE).all(axis=2)
+    if allow_nested:
+        inside = ((lo[:, None] >= lo[None] - TOLERANCE) & (hi[:, None] <= hi[None] + TOLERANCE)).all(axis=2)
+        hit &= ~(inside | inside.T)
+    i, j = np.nonzero(np.triu(hit, k=1))
+    return list(zip(i.tolist(), j.tolist()))
+
+
+def inspect(scene, issues, play_index):
+    """Record any new layout problems in the scene's current state."""
+    from manim import config
+
+    texts, boxes = collect(scene.mobjects + scene.foreground_mobjects)
+    cx, cy = scene.renderer.camera.frame_center[:2]
+    half = np.array([config.frame_width / 2, config.frame_height / 2])
+    frame_lo, frame_hi = np.array([cx, cy]) - half, np.array([cx, cy]) + half
+
+    def report(key, message):
+        issues.setdefault(key, (play_index, message))
+
+    for kind, mobs, allow_nested in (("text", texts, False), ("box", boxes, True)):
+        lo, hi = bounds(mobs)
+        outside = ((lo < frame_lo - TOLERANCE) | (hi > frame_hi + TOLERANCE)).any(axis=1)
+        for i in np.nonzero(outside)[0]:
+            report(("off-frame", id(mobs[i])), f"off-frame {kind}: {describe(mobs[i])}")
+        for i, j in overlapping_pairs(lo, hi, allow_nested):
+            a, b = sorted((describe(mobs[i]), describe(mobs[j])))
+            report((kind, id(mobs[i]), id(mobs[j])), f"{kind} overlap: {a} / {b}")
+
+
+def check_scene(path, scene_name):
+    """
+    Worker: run one scene's construct without rendering.
+    Returns (scene_name, seconds, plays, issues, final bounding boxes).
+    """
+    from manim import tempconfig
+
+    start = time.perf_counter()
+    scene_cls = load_scene_class(Path(path), scene_name)
+    cfg = {
+        "dry_run": True,
+        "disable_caching": True,
+        "media_dir": str(MEDIA / "layout"),
+        "input_file": str(path),
+        "preview": False,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+    }
+    issues = {}
+    with tempconfig(cfg):
+        scene = scene_cls(skip_animations=True)
+        # Skipped plays still paint static mobjects and the final frame; stop that
+        scene.renderer.update_frame = lambda *args, **kwargs: None
+
+        def checked_play(play):
+            def wrapper(*args, **kwargs):
+                result = play(*args, **kwargs)
+                inspect(scene, issues, scene.renderer.num_plays)
+                return result
+            return wrapper
+
+        scene.play = checked_play(scene.play)
+        scene.render()
+        inspect(scene, issues, scene.renderer.num_plays)
+
+        final = []
+        for mob in scene.mobjects:
+            lo, hi = bounds([mob])
+            final.append((describe(mob), *lo[0].round(2).tolist(), *hi[0].round(2).tolist()))
+        plays = scene.renderer.num_plays
+
+    ordered = sorted(issues.values(), key=lambda item: item[0])
+    return scene_name, time.perf_counter() - start, plays, ordered, final
+
+
+def check_all(scene_names=None, jobs=None, show_boxes=False):
+    scenes = discover_scenes()
+    if scene_names:
+        missing = [s for s in scene_names if s not in scenes]
+        if missing:
+            raise SystemExit(f"Unknown scene(s): {', '.join(missing)}")
+        scenes = {s: scenes[s] for s in scene_names}
+
+    start = time.perf_counter()
+    jobs = jobs or min(os.cpu_count() or 1, len(scenes))
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(check_scene, str(path), name) for name, path in scenes.items()]
+        for future in as_completed(futures):
+            name, *rest = future.result()
+            results[name] = rest
+
+    problems = 0
+    for name in scenes:
+        seconds, plays, issues, final = results[name]
+        status = "ok" if not issues else f"{len(issues)} issue(s)"
+        print(f"{name:<36} {plays:4d} plays {seconds:6.2f}s  {status}")
+        for play_index, message in issues:
+            print(f"    after play {play_index:<4d} {message}")
+        if show_boxes:
+            for label, x0, y0, x1, y1 in final:
+                print(f"    [{x0:6.2f}, {y0:6.2f}] - [{x1:6.2f}, {y1:6.2f}]  {label}")
+        problems += len(issues)
+
+    print(f"Checked {len(scenes)} scene(s) in {time.perf_counter() - start:.1f}s, {problems} issue(s)")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--boxes", action="store_true", help="print final bounding boxes of top-level mobjects")
+    args = parser.parse_args()
+
+    raise SystemExit(1 if check_all(args.scenes, jobs=args.jobs, show_boxes=args.boxes) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Many line graphs on one set of axes, built in a single vectorized pass.
+
+Axes.plot_line_graph converts every vertex with its own coords_to_point
+call and wraps each curve in a VDict. MultiLineGraph maps a whole
+(series x points) array to scene coordinates with one affine transform and
+gives each series a single VMobject path, so every curve can still be
+animated on its own with Create(graph[i]).
+
+Long series are reduced with min/max decimation to about one vertex per
+pixel column of the plotted width, and never more than MAX_POINTS: every
+two-column bucket keeps its lowest and highest vertex, so peaks survive and
+the drawn shape is unchanged.
+"""
+
+import numpy as np
+from manim import VGroup, VMobject, WHITE, config
+
+# Vertex ceiling per series, whatever the render width
+MAX_POINTS = 512
+
+
+def minmax_decimate(y_values, buckets):
+    """
+    Indices (series x at most (2 * buckets + 2)) of each bucket's min and
+    max vertex, in x order, plus the first and last vertex of every series.
+    """
+    n_series, n = y_values.shape
+    size = -(-n // buckets)
+    buckets = -(-n // size)
+    padded = np.pad(y_values, ((0, 0), (0, buckets * size - n)), mode="edge")
+    padded = padded.reshape(n_series, buckets, size)
+
+    offsets = np.arange(buckets) * size
+    lo = padded.argmin(axis=2) + offsets
+    hi = padded.argmax(axis=2) + offsets
+    inner = np.sort(np.stack([lo, hi], axis=2), axis=2).reshape(n_series, -1)
+    inner = np.minimum(inner, n - 1)
+
+    first = np.zeros((n_series, 1), dtype=inner.dtype)
+    last = np.full((n_series, 1), n - 1, dtype=inner.dtype)
+    return np.concatenate([first, inner, last], axis=1)
+
+
+class MultiLineGraph(VGroup):
+    """
+    One VMobject per row of y_values, plotted against x_values on axes.
+    Axes must use linear scaling. max_points caps the vertices per series;
+    by default it is one per pixel column of the plotted width, up to
+    MAX_POINTS.
+    """
+
+    def __init__(self, axes, x_values, y_values, colors=(WHITE,), stroke_width=3,
+                 max_points=None, **kwargs):
+        super().__init__(**kwargs)
+        xs = np.asarray(x_values, dtype=float)
+        ys = np.atleast_2d(np.asarray(y_values, dtype=float))
+
+        # coords_to_point is affine on linear axes: origin + x * ex + y * ey
+        origin = np.asarray(axes.c2p(0, 0))
+        ex = np.asarray(axes.c2p(1, 0)) - origin
+        ey = np.asarray(axes.c2p(0, 1)) - origin
+
+        if max_points is None:
+            width = abs(ex[0]) * (xs.max() - xs.min()) if len(xs) > 1 else 0.0
+            max_points = int(width * config.pixel_width / config.frame_width)
+            max_points = min(max(4, max_points), MAX_POINTS)
+
+        if ys.shape[1] > max_points:
+            idx = minmax_decimate(ys, max(1, (max_points - 2) // 2))
+            px, py = xs[idx], np.take_along_axis(ys, idx, axis=1)
+        else:
+            px, py = np.broadcast_to(xs, ys.shape), ys
+
+        # (series, vertices, 3) in scene coordinates
+        points = origin + px[..., None] * ex + py[..., None] * ey
+
+        self.add(*[
+            VMobject(stroke_color=colors[i % len(colors)], stroke_width=stroke_width)
+            .set_points_as_corners(series)
+            for i, series in enumerate(points)
+        ])
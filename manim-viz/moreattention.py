@@ -1,13 +1,80 @@
 """
 Self-Attention Mechanism Animation using Manim
-Run with: manim -pql hello2.py SelfAttentionAnimation
+Run with: manim -pql moreattention.py SelfAttentionAnimation
+Another query token: python render.py SelfAttentionAnimation --set query=river
 """
 
 from manim import *
 import numpy as np
+import textwrap
+
+from attention_engine import attend
+from components import make_cell
+from multi_arrow import MultiArrow
+from tex_batch import escape_tex
+from text_cache import cached_text, log_text_cache_stats
 
 
 class SelfAttentionAnimation(Scene):
+    words = ["He", "sat", "on", "the", "river", "bank"]
+    # Query token whose attention is shown (a word or an index into words);
+    # render.py --set query=... picks another without editing this file
+    query = "bank"
+
+    # Layout: width available to a token row, the column pitch at full size,
+    # the smallest readable scale, and the gap between the stages
+    max_width = 13.0
+    pitch = 1.85
+    min_scale = 0.5
+    stage_buff = 0.65
+
+    def columns(self, n, room=None, row_height=1.0, row_buff=0.0):
+        """
+        (tokens per row, scale) for n tokens: the largest scale at which a row
+        fits max_width and, if room is given, the rows (row_height each at
+        full size, row_buff apart) fit in room. Ties go to fewer rows.
+        """
+        best = (n, 0.0)
+        for per_row in range(n, 0, -1):
+            scale = min(1.0, self.max_width / (per_row * self.pitch))
+            if room is not None:
+                rows = -(-n // per_row)
+                scale = min(scale, room / (rows * (row_height + row_buff) - row_buff))
+            if scale > best[1]:
+                best = (per_row, scale)
+        return best
+
+    def pages(self, n, room, row_height, row_buff=0.0):
+        """
+        (tokens per page, tokens per row, scale): every token on one page if
+        they fit at min_scale or larger, otherwise as many per page as do.
+        """
+        for per_page in range(n, 0, -1):
+            per_row, scale = self.columns(per_page, room, row_height, row_buff)
+            if scale >= self.min_scale:
+                return per_page, per_row, scale
+        raise ValueError(
+            f"No room for one token at scale {self.min_scale}: {room:.2f} units high"
+        )
+
+    def token_grid(self, cells, per_row, scale, row_buff=0.25):
+        """Scale the per-token cells and arrange them on the shared column grid."""
+        cells.scale(scale)
+        cols = min(per_row, len(cells))
+        return cells.arrange_in_grid(
+            cols=cols, col_widths=[self.pitch * scale] * cols, buff=(0, row_buff * scale)
+        )
+
+    @staticmethod
+    def column_ends(mobs, per_row, bottom=True):
+        """The lowest (or highest) mobject in each column of a token grid."""
+        n = len(mobs)
+        if not bottom:
+            return [mobs[j] for j in range(min(per_row, n))]
+        last = (n - 1) // per_row * per_row
+        return [mobs[last + j] if last + j < n else mobs[last + j - per_row]
+                for j in range(min(per_row, n))]
+
     def construct(self):
         # Colors
         QUERY_COLOR = "#81c784"  # Green
@@ -17,179 +84,84 @@ class SelfAttentionAnimation(Scene):
         OUTPUT_COLOR = "#ce93d8"  # Purple
 
         # Title
-        title = Text("Self-Attention", font_size=36)
+        title = cached_text("Self-Attention", font_size=36)
         title.to_edge(UP, buff=0.3)
         self.play(FadeIn(title))
 
+        words = self.words
+        n = len(words)
+        attn = attend(words, query=self.query)
+        qi = attn["query"]
+        query = words[qi]
+        scores = attn["scores"][qi]
+        weights = attn["weights"][qi]
+
         # Explain X
-        x_explain = Text(
-            "X = [He, sat, on, the, river, bank]", font_size=22, color=GRAY
-        )
+        x_text = f"X = [{', '.join(words)}]"
+        x_explain = cached_text(x_text, font_size=22, color=GRAY)
+        if x_explain.width > self.max_width:
+            # Wrap at word boundaries instead of shrinking past readability
+            chars = int(0.95 * len(x_text) * self.max_width / x_explain.width)
+            x_explain = VGroup(*[
+                cached_text(line, font_size=22, color=GRAY)
+                for line in textwrap.wrap(x_text, chars)
+            ]).arrange(DOWN, aligned_edge=LEFT, buff=0.1)
+            if x_explain.width > self.max_width:
+                x_explain.scale_to_fit_width(self.max_width)
         x_explain.next_to(title, DOWN, buff=0.2)
-        self.play(FadeIn(x_explain))
-        self.wait(0.5)
 
         # --- TOP ROW: Q and K pairs producing scores ---
-        words = ["He", "sat", "on", "the", "river", "bank"]
-
-        # Create Q boxes (all q_bank since we're computing attention for "bank")
-        q_boxes = VGroup()
-        for i in range(6):
-            q_box = VGroup(
-                Rectangle(
-                    width=0.8,
-                    height=0.4,
-                    fill_color=QUERY_COLOR,
-                    fill_opacity=0.8,
-                    stroke_width=1,
-                ),
-            )
-            q_label = Text("q_bank", font_size=10, color=BLACK)
-            q_label.move_to(q_box)
-            q_boxes.add(VGroup(q_box, q_label))
+        # Create Q boxes (all the query's q, since we're computing its attention)
+        q_boxes = VGroup(*[
+            make_cell(f"q_{query}", QUERY_COLOR, width=0.8, height=0.4, font_size=10)
+            for _ in range(n)
+        ])
 
         # Create K boxes
-        k_boxes = VGroup()
-        for word in words:
-            k_box = VGroup(
-                Rectangle(
-                    width=0.4,
-                    height=0.6,
-                    fill_color=KEY_COLOR,
-                    fill_opacity=0.8,
-                    stroke_width=1,
-                ),
-            )
-            k_label = Text(f"k_{word}", font_size=9, color=BLACK)
-            k_label.move_to(k_box)
-            k_boxes.add(VGroup(k_box, k_label))
+        k_boxes = VGroup(*[
+            make_cell(f"k_{word}", KEY_COLOR, width=0.4, height=0.6, font_size=9)
+            for word in words
+        ])
 
-        # Score labels
-        score_labels = VGroup()
-        for i in range(6):
-            s_label = Text(f"s{i + 1}", font_size=14, color=WHITE)
-            score_labels.add(s_label)
+        # Score labels: scaled dot products q·k / sqrt(d)
+        score_labels = VGroup(*[
+            cached_text(f"{scores[i]:.2f}", font_size=14, color=WHITE) for i in range(n)
+        ])
 
-        # Arrange Q-K pairs horizontally
         qk_pairs = VGroup()
-        for i in range(6):
+        for i in range(n):
             pair = VGroup(q_boxes[i], k_boxes[i], score_labels[i])
             q_boxes[i].move_to(ORIGIN)
             k_boxes[i].next_to(q_boxes[i], DOWN, buff=0.1)
             score_labels[i].next_to(q_boxes[i], RIGHT, buff=0.1)
             qk_pairs.add(pair)
 
-        qk_pairs.arrange(RIGHT, buff=0.6)
-        qk_pairs.move_to(UP * 1.8)
+        # --- Weights, each with its value box below ---
+        weight_labels = VGroup(*[
+            cached_text(f"{weights[i]:.2f}", font_size=14, color=WHITE) for i in range(n)
+        ])
+        v_boxes = VGroup(*[
+            make_cell(f"v_{word}", VALUE_COLOR, width=0.7, height=0.4, font_size=9)
+            for word in words
+        ])
+        wv_pairs = VGroup()
+        for w, vb in zip(weight_labels, v_boxes):
+            vb.next_to(w, DOWN, buff=0.3)
+            wv_pairs.add(VGroup(w, vb))
 
-        self.play(
-            LaggedStart(*[FadeIn(q) for q in q_boxes], lag_ratio=0.1),
-            LaggedStart(*[FadeIn(k) for k in k_boxes], lag_ratio=0.1),
+        # --- Softmax, one slot per column ---
+        slot = 0.6
+        softmax_box = Rectangle(
+            width=4,
+            height=0.6,
+            fill_color=SOFTMAX_COLOR,
+            fill_opacity=0.9,
+            stroke_width=1,
         )
-        self.wait(0.3)
-        self.play(LaggedStart(*[FadeIn(s) for s in score_labels], lag_ratio=0.1))
-        self.wait(0.5)
-
-        # --- Arrows from scores to softmax ---
-        softmax_box = VGroup(
-            Rectangle(
-                width=4,
-                height=0.6,
-                fill_color=SOFTMAX_COLOR,
-                fill_opacity=0.9,
-                stroke_width=1,
-            ),
-        )
-        softmax_label = Text("Softmax", font_size=20, color=BLACK)
-        softmax_label.move_to(softmax_box)
+        softmax_label = cached_text("Softmax", font_size=20, color=BLACK)
         softmax_group = VGroup(softmax_box, softmax_label)
-        softmax_group.move_to(UP * 0.3)
-
-        # Arrows from scores to softmax
-        arrows_to_softmax = VGroup()
-        for i, s in enumerate(score_labels):
-            arrow = Arrow(
-                s.get_bottom(),
-                softmax_box.get_top() + LEFT * (2.5 - i) * 0.6,
-                buff=0.1,
-                color=GRAY,
-                stroke_width=2,
-                max_tip_length_to_length_ratio=0.15,
-            )
-            arrows_to_softmax.add(arrow)
-
-        self.play(
-            LaggedStart(*[GrowArrow(a) for a in arrows_to_softmax], lag_ratio=0.05),
-            FadeIn(softmax_group),
-        )
-        self.wait(0.5)
 
-        # --- Arrows from softmax to weights ---
-        weight_labels = VGroup()
-        for i in range(6):
-            w_label = Text(f"w{i + 1}", font_size=14, color=WHITE)
-            weight_labels.add(w_label)
-        weight_labels.arrange(RIGHT, buff=0.7)
-        weight_labels.move_to(DOWN * 0.8)
-
-        arrows_from_softmax = VGroup()
-        for i, w in enumerate(weight_labels):
-            arrow = Arrow(
-                softmax_box.get_bottom() + LEFT * (2.5 - i) * 0.6,
-                w.get_top(),
-                buff=0.1,
-                color=GRAY,
-                stroke_width=2,
-                max_tip_length_to_length_ratio=0.15,
-            )
-            arrows_from_softmax.add(arrow)
-
-        self.play(
-            LaggedStart(*[GrowArrow(a) for a in arrows_from_softmax], lag_ratio=0.05),
-            LaggedStart(*[FadeIn(w) for w in weight_labels], lag_ratio=0.05),
-        )
-        self.wait(0.5)
-
-        # --- Value boxes ---
-        v_boxes = VGroup()
-        for word in words:
-            v_box = VGroup(
-                Rectangle(
-                    width=0.7,
-                    height=0.4,
-                    fill_color=VALUE_COLOR,
-                    fill_opacity=0.8,
-                    stroke_width=1,
-                ),
-            )
-            v_label = Text(f"v_{word}", font_size=9, color=BLACK)
-            v_label.move_to(v_box)
-            v_boxes.add(VGroup(v_box, v_label))
-
-        # Position value boxes below weights
-        for i, vb in enumerate(v_boxes):
-            vb.next_to(weight_labels[i], DOWN, buff=0.3)
-
-        # Arrows from weights to values
-        arrows_to_values = VGroup()
-        for i in range(6):
-            arrow = Arrow(
-                weight_labels[i].get_bottom(),
-                v_boxes[i].get_top(),
-                buff=0.1,
-                color=GRAY,
-                stroke_width=2,
-                max_tip_length_to_length_ratio=0.2,
-            )
-            arrows_to_values.add(arrow)
-
-        self.play(
-            LaggedStart(*[GrowArrow(a) for a in arrows_to_values], lag_ratio=0.05),
-            LaggedStart(*[FadeIn(v) for v in v_boxes], lag_ratio=0.05),
-        )
-        self.wait(0.5)
-
-        # --- Output y_bank ---
+        # --- Output y_query ---
         output_box = VGroup(
             Rectangle(
                 width=1.2,
@@ -199,25 +171,17 @@ class SelfAttentionAnimation(Scene):
                 stroke_width=1,
             ),
         )
-        output_label = Text("y_bank", font_size=14, color=BLACK)
+        output_label = cached_text(f"y_{query}", font_size=14, color=BLACK)
         output_label.move_to(output_box)
         output_group = VGroup(output_box, output_label)
-        output_group.move_to(DOWN * 2.5)
-
-        arrow_to_output = Arrow(
-            v_boxes.get_bottom(),
-            output_group.get_top(),
-            buff=0.15,
-            color=GRAY,
-            stroke_width=2,
+        y = attn["output"][qi]
+        output_values = cached_text(
+            "[" + ", ".join(f"{v:.2f}" for v in y[:3]) + ", …]", font_size=14, color=GRAY
         )
 
-        self.play(GrowArrow(arrow_to_output), FadeIn(output_group))
-        self.wait(0.5)
-
         # --- Final formula ---
         final_formula = MathTex(
-            r"y_{bank} = \sum_i w_i \cdot v_i",
+            rf"y_{{\text{{{escape_tex(query)}}}}} = \sum_i w_i \cdot v_i",
             font_size=26,
             color=WHITE,
         )
@@ -227,9 +191,127 @@ class SelfAttentionAnimation(Scene):
         final_group = VGroup(final_formula, final_box)
         final_group.to_edge(DOWN, buff=0.2)
 
+        # Budget the height between the sentence and the formula: what the
+        # softmax and output stages leave is shared by the token rows, one
+        # Q/K row plus one weight/value row each. Tokens that do not fit at
+        # min_scale go on further pages instead of shrinking the diagram.
+        top = x_explain.get_bottom()[1] - 0.2
+        bottom = final_group.get_top()[1] + 0.2
+        room = (top - bottom - softmax_group.height - output_group.height
+                - 3 * self.stage_buff)
+        row_height = qk_pairs[0].height + wv_pairs[0].height
+        per_page, per_row, scale = self.pages(n, room, row_height, row_buff=0.25 + 0.4)
+        cols = min(per_row, n)
+
+        softmax_box.stretch_to_fit_width(max(4, slot * cols + 0.4))
+        softmax_label.move_to(softmax_box)
+        page_starts = range(0, n, per_page)
+        for start in page_starts:
+            self.token_grid(qk_pairs[start:start + per_page], per_row, scale)
+            self.token_grid(wv_pairs[start:start + per_page], per_row, scale, row_buff=0.4)
+
+        # Stack the stages of the first (fullest) page; later pages hang
+        # their rows off the same softmax bar
+        diagram = VGroup(qk_pairs[:per_page], softmax_group, wv_pairs[:per_page], output_group)
+        diagram.arrange(DOWN, buff=self.stage_buff)
+        diagram.move_to(UP * (top + bottom) / 2)
+        output_values.next_to(output_group, RIGHT, buff=0.2)
+        page_label = None
+
+        self.play(FadeIn(x_explain))
+        self.wait(0.5)
+
+        for start in page_starts:
+            page = slice(start, start + per_page)
+            count = len(words[page])
+            cols = min(per_row, count)
+            qk_pairs[page].next_to(softmax_group, UP, buff=self.stage_buff)
+            wv_pairs[page].next_to(softmax_group, DOWN, buff=self.stage_buff)
+
+            # Arrows, one batched mobject per stage, from the final positions
+            slots = [softmax_box.get_center() + RIGHT * (j - (cols - 1) / 2) * slot
+                     for j in range(cols)]
+            arrows_to_softmax = MultiArrow(
+                [s.get_bottom() for s in self.column_ends(score_labels[page], per_row)],
+                [p + UP * softmax_box.height / 2 for p in slots],
+                color=GRAY, stroke_width=2, max_tip_length_to_length_ratio=0.15,
+            )
+            arrows_from_softmax = MultiArrow(
+                [p + DOWN * softmax_box.height / 2 for p in slots],
+                [w.get_top() for w in self.column_ends(weight_labels[page], per_row, bottom=False)],
+                color=GRAY, stroke_width=2, max_tip_length_to_length_ratio=0.15,
+            )
+            arrows_to_values = MultiArrow(
+                [w.get_bottom() for w in weight_labels[page]],
+                [vb.get_top() for vb in v_boxes[page]],
+                buff=0.1 * scale, color=GRAY, stroke_width=2, max_tip_length_to_length_ratio=0.2,
+            )
+
+            if per_page < n:
+                label = cached_text(
+                    f"tokens {start + 1}–{start + count} of {n}", font_size=16, color=GRAY
+                ).to_edge(LEFT).match_y(softmax_group)
+                self.play(FadeIn(label) if page_label is None else FadeTransform(page_label, label))
+                page_label = label
+
+            self.play(
+                LaggedStart(*[FadeIn(q) for q in q_boxes[page]], lag_ratio=0.1),
+                LaggedStart(*[FadeIn(k) for k in k_boxes[page]], lag_ratio=0.1),
+            )
+            self.wait(0.3)
+            self.play(LaggedStart(*[FadeIn(s) for s in score_labels[page]], lag_ratio=0.1))
+            self.wait(0.5)
+
+            if start == 0:
+                self.play(Create(arrows_to_softmax, lag_ratio=0), FadeIn(softmax_group))
+            else:
+                self.play(Create(arrows_to_softmax, lag_ratio=0))
+            self.wait(0.5)
+
+            self.play(
+                Create(arrows_from_softmax, lag_ratio=0),
+                LaggedStart(*[FadeIn(w) for w in weight_labels[page]], lag_ratio=0.05),
+            )
+            self.wait(0.5)
+
+            self.play(
+                Create(arrows_to_values, lag_ratio=0),
+                LaggedStart(*[FadeIn(v) for v in v_boxes[page]], lag_ratio=0.05),
+            )
+            self.wait(0.5)
+
+            if start + per_page < n:
+                self.play(FadeOut(
+                    qk_pairs[page], wv_pairs[page],
+                    arrows_to_softmax, arrows_from_softmax, arrows_to_values,
+                ))
+
+        arrow_to_output = Arrow(
+            v_boxes[page].get_bottom(),
+            output_group.get_top(),
+            buff=0.15,
+            color=GRAY,
+            stroke_width=2,
+        )
+        self.play(GrowArrow(arrow_to_output), FadeIn(output_group), FadeIn(output_values))
+        self.wait(0.5)
+
         self.play(FadeIn(final_formula), Create(final_box))
         self.wait(2)
+        log_text_cache_stats(type(self).__name__)
+
+
+class SelfAttentionLongSequence(SelfAttentionAnimation):
+    """The same scene for a 64-token passage, over several pages of wrapped rows."""
+
+    words = (
+        "He sat on the river bank and watched the water move slowly past the old stone "
+        "bridge while children threw bread to the ducks and a fisherman waited patiently "
+        "for a bite as the afternoon light turned gold over the fields and the town behind "
+        "him grew quiet until the bells rang out from the church across the square and he "
+        "walked home slowly"
+    ).split()
 
 
 if __name__ == "__main__":
-    print("Run with: manim -pql hello2.py SelfAttentionAnimation")
+    print("Run with: manim -pql moreattention.py SelfAttentionAnimation")
@@ -0,0 +1,90 @@
+from manim import *
+import numpy as np
+
+from attention_engine import layer_attention_maps, token_embeddings
+from heatmap import Heatmap
+from positional_encoding import pe_matrix
+from profiling import ProfiledScene
+from text_cache import cached_text, log_text_cache_stats
+
+
+class MultiHeadAttentionMaps(ProfiledScene):
+    """
+    N x N attention weights of every head, one layer at a time. Each head is
+    a single Heatmap bound to a layer tracker: moving the tracker blends the
+    two neighbouring layers' maps and rewrites the images in place.
+    """
+
+    seq_len = 128
+    n_layers = 4
+    n_heads = 4
+    d_model = 32
+
+    def attention_maps(self):
+        # Token identity plus position, so heads can pick up both
+        tokens = [f"tok{i % 40}" for i in range(self.seq_len)]
+        x = token_embeddings(tokens, self.d_model) + 2 * pe_matrix(self.seq_len, self.d_model)
+        return layer_attention_maps(x, self.n_layers, self.n_heads)
+
+    def construct(self):
+        with self.span("attention maps"):
+            maps = self.attention_maps()
+        # Most weights are tiny; saturate at the 99th percentile so structure shows
+        vmax = float(np.percentile(maps, 99))
+
+        title = cached_text("Attention weights per head", font_size=34)
+        title.to_edge(UP, buff=0.3)
+        layer_label = cached_text("Layer 1", font_size=28, color=YELLOW)
+        layer_label.next_to(title, DOWN, buff=0.2)
+
+        layer = ValueTracker(0.0)
+
+        def blended(head):
+            def source():
+                t = layer.get_value()
+                lo = min(int(t), self.n_layers - 1)
+                hi = min(lo + 1, self.n_layers - 1)
+                f = np.float32(t - lo)
+                return maps[lo, head] * (1 - f) + maps[hi, head] * f
+            return source
+
+        with self.span("build heatmaps"):
+            size = (config.frame_width - 1.5) / self.n_heads - 0.3
+            heads = Group()
+            for head in range(self.n_heads):
+                heatmap = Heatmap(
+                    maps[0, head],
+                    cell_size=size / self.seq_len,
+                    value_range=(0.0, vmax),
+                    colors=(BLACK, BLUE, YELLOW),
+                )
+                label = cached_text(f"Head {head + 1}", font_size=22).next_to(heatmap, UP, buff=0.15)
+                heads.add(Group(heatmap, label))
+            heads.arrange(RIGHT, buff=0.3).next_to(layer_label, DOWN, buff=0.4)
+
+        axis_note = cached_text("rows: queries   columns: keys", font_size=20, color=GRAY)
+        axis_note.next_to(heads, DOWN, buff=0.3)
+
+        self.play(FadeIn(title), FadeIn(layer_label))
+        self.play(FadeIn(heads), FadeIn(axis_note))
+        for head, (heatmap, _) in enumerate(heads):
+            heatmap.bind(blended(head))
+        self.wait(0.5)
+
+        for target in range(1, self.n_layers):
+            new_label = cached_text(f"Layer {target + 1}", font_size=28, color=YELLOW)
+            new_label.move_to(layer_label)
+            self.play(
+                layer.animate.set_value(target),
+                FadeOut(layer_label),
+                FadeIn(new_label),
+                run_time=2,
+                rate_func=smooth,
+            )
+            layer_label = new_label
+            self.wait(0.8)
+
+        for heatmap, _ in heads:
+            heatmap.clear_updaters()
+        self.wait(1)
+        log_text_cache_stats(type(self).__name__)
@@ -0,0 +1,77 @@
+"""
+Hundreds to thousands of 2D word vectors as one mobject.
+
+VectorCloud keeps the vectors in an (N, 2) array in axes coordinates and
+draws their tips as a single PMobject (one pixel-splat pass in the Cairo
+camera, not N circles). Arrows from the origin can be drawn for a subset
+of rows as one MultiArrow. set_vectors maps the whole array to the scene
+with one affine transform and writes the points in place, so moving every
+vector from an updater costs a few array operations per frame.
+"""
+
+import numpy as np
+from manim import Group, PMobject, WHITE, YELLOW, color_to_rgba
+
+from multi_arrow import MultiArrow
+
+
+class VectorCloud(Group):
+    """
+    Group(dots[, arrows]) for vectors (N, 2) on linear axes. colors is one
+    color or one per vector; arrows is a list of row indices to draw as
+    arrows from the origin.
+    """
+
+    def __init__(self, axes, vectors, colors=WHITE, dot_size=4, arrows=(), arrow_color=YELLOW,
+                 arrow_width=3, **kwargs):
+        super().__init__(**kwargs)
+        # coords_to_point is affine on linear axes: origin + x * ex + y * ey
+        self.origin = np.asarray(axes.c2p(0, 0))
+        self.ex = np.asarray(axes.c2p(1, 0)) - self.origin
+        self.ey = np.asarray(axes.c2p(0, 1)) - self.origin
+        self.vectors = np.array(vectors, dtype=float)
+        self.arrow_rows = np.asarray(arrows, dtype=int)
+
+        n = len(self.vectors)
+        if isinstance(colors, (list, tuple)):
+            rgbas = np.array([color_to_rgba(c) for c in colors])
+        else:
+            rgbas = np.tile(color_to_rgba(colors), (n, 1))
+
+        self.dots = PMobject(stroke_width=dot_size)
+        self.dots.add_points(self._scene_points(), rgbas=rgbas)
+        self.add(self.dots)
+
+        self.arrows = None
+        if len(self.arrow_rows):
+            tips = self._scene_points()[self.arrow_rows]
+            self.arrows = MultiArrow(
+                np.broadcast_to(self.origin, tips.shape), tips, color=arrow_color,
+                stroke_width=arrow_width, buff=0, tip_length=0.2, max_tip_length_to_length_ratio=0.12,
+            )
+            self.add(self.arrows)
+
+    def _scene_points(self):
+        v = self.vectors
+        return self.origin + v[:, :1] * self.ex + v[:, 1:2] * self.ey
+
+    def set_vectors(self, vectors):
+        """Move every vector to the new (N, 2) values."""
+        self.vectors[:] = vectors
+        points = self._scene_points()
+        self.dots.points[:] = points
+        if self.arrows is not None:
+            tips = points[self.arrow_rows]
+            self.arrows.set_arrows(np.broadcast_to(self.origin, tips.shape), tips)
+        return self
+
+    def follow(self, source):
+        """
+        Keep the cloud at source() (a function returning (N, 2) vectors)
+        with one updater; returns the updater so it can be removed.
+        """
+        def update(mob):
+            mob.set_vectors(source())
+
+        self.add_updater(update)
+        return update
@@ -0,0 +1,137 @@
+"""
+Sinusoidal positional-encoding engine shared by the scenes.
+
+PE[pos, 2k]   = sin(pos / base^(2k / d_model))
+PE[pos, 2k+1] = cos(pos / base^(2k / d_model))
+
+Small tables are memoized per (seq_len, d_model, base, dtype). Large tables
+are generated in row chunks, either streamed with pe_chunks or written to a
+memory-mapped .npy file with pe_memmap, so the full float64 table never
+needs to exist in RAM.
+"""
+
+from collections import OrderedDict
+import os
+import numpy as np
+
+# Cache bounds: whichever limit is hit first evicts the least recently used table
+MAX_CACHED_TABLES = 16
+MAX_CACHED_BYTES = 256 * 1024 * 1024
+
+DEFAULT_CHUNK_ROWS = 4096
+
+_cache = OrderedDict()
+_cache_bytes = 0
+_hits = 0
+_misses = 0
+
+
+def inverse_frequencies(d_model: int, base: float = 10000.0) -> np.ndarray:
+    """
+    Per-dimension angular frequency 1 / base^(2i/d_model), shape (d_model,).
+    Dims come in sin/cos pairs: 0,0,1,1,2,2...
+    """
+    pair_i = np.arange(d_model) // 2
+    return 1.0 / np.power(base, (2.0 * pair_i) / d_model)
+
+
+def pe_block(start: int, stop: int, d_model: int, base: float = 10000.0, dtype=np.float32):
+    """
+    Rows [start, stop) of the PE table. Angles are computed in float64 so
+    large positions keep their precision, then cast to dtype.
+    """
+    pos = np.arange(start, stop, dtype=np.float64)[:, None]     # (rows, 1)
+    angles = pos * inverse_frequencies(d_model, base)[None, :]  # (rows, d_model)
+
+    block = np.empty(angles.shape, dtype=dtype)
+    block[:, 0::2] = np.sin(angles[:, 0::2])                    # even dims
+    block[:, 1::2] = np.cos(angles[:, 1::2])                    # odd dims
+    return block
+
+
+def pe_chunks(seq_len: int, d_model: int, base: float = 10000.0, dtype=np.float32,
+              chunk_rows: int = DEFAULT_CHUNK_ROWS):
+    """
+    Yield (start, block) pairs covering the table chunk_rows rows at a time.
+    """
+    for start in range(0, seq_len, chunk_rows):
+        stop = min(start + chunk_rows, seq_len)
+        yield start, pe_block(start, stop, d_model, base, dtype)
+
+
+def pe_matrix(seq_len: int, d_model: int, base: float = 10000.0, dtype=np.float32):
+    """
+    Returns PE of shape (seq_len, d_model), memoized.
+    The returned array is shared with the cache and therefore read-only.
+    """
+    global _cache_bytes, _hits, _misses
+
+    dtype = np.dtype(dtype)
+    key = (seq_len, d_model, float(base), dtype.str)
+    if key in _cache:
+        _hits += 1
+        _cache.move_to_end(key)
+        return _cache[key]
+
+    _misses += 1
+    pe = np.empty((seq_len, d_model), dtype=dtype)
+    for start, block in pe_chunks(seq_len, d_model, base, dtype):
+        pe[start:start + len(block)] = block
+    pe.flags.writeable = False
+
+    # Tables larger than the whole budget are returned uncached
+    if pe.nbytes <= MAX_CACHED_BYTES:
+        _cache[key] = pe
+        _cache_bytes += pe.nbytes
+        while len(_cache) > MAX_CACHED_TABLES or _cache_bytes > MAX_CACHED_BYTES:
+            _, evicted = _cache.popitem(last=False)
+            _cache_bytes -= evicted.nbytes
+    return pe
+
+
+def pe_memmap(path, seq_len: int, d_model: int, base: float = 10000.0, dtype=np.float32,
+              chunk_rows: int = DEFAULT_CHUNK_ROWS):
+    """
+    Write the table to a .npy file chunk by chunk and return it memory-mapped
+    (read-only). An existing file is reused when its shape, dtype and last row
+    match the requested table.
+    """
+    dtype = np.dtype(dtype)
+    try:
+        existing = np.load(path, mmap_mode="r")
+        if (
+            existing.shape == (seq_len, d_model)
+            and existing.dtype == dtype
+            and np.array_equal(existing[-1:], pe_block(seq_len - 1, seq_len, d_model, base, dtype))
+        ):
+            return existing
+    except (FileNotFoundError, ValueError):
+        pass
+
+    # Write under a temporary name so an interrupted run never leaves a
+    # half-filled table that looks valid
+    tmp_path = f"{path}.partial"
+    out = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=dtype, shape=(seq_len, d_model))
+    for start, block in pe_chunks(seq_len, d_model, base, dtype, chunk_rows):
+        out[start:start + len(block)] = block
+    out.flush()
+    del out
+    os.replace(tmp_path, path)
+    return np.load(path, mmap_mode="r")
+
+
+def cache_info():
+    return {
+        "hits": _hits,
+        "misses": _misses,
+        "tables": len(_cache),
+        "bytes": _cache_bytes,
+    }
+
+
+def clear_cache():
+    global _cache_bytes, _hits, _misses
+    _cache.clear()
+    _cache_bytes = 0
+    _hits = 0
+    _misses = 0
@@ -1,54 +1,18 @@
 from manim import *
 import numpy as np
 
-class PositionalEncodingWavesToHeatmap(Scene):
-    def pe_matrix(self, seq_len: int, d_model: int, base: float = 10000.0):
+from heatmap import ColumnSweep, Heatmap
+from line_graph import MultiLineGraph
+from positional_encoding import pe_matrix
+from profiling import ProfiledScene
+from tex_batch import precompile_tex
+
+class PositionalEncodingWavesToHeatmap(ProfiledScene):
+    def make_heatmap(self, pe: np.ndarray, cell_size=0.10):
         """
-        Returns PE of shape (seq_len, d_model) using the classic sin/cos formula.
+        Render PE matrix as a single array-backed image (rows=pos, cols=dim).
         """
-        pos = np.arange(seq_len)[:, None]                      # (seq_len, 1)
-        i = np.arange(d_model)[None, :]                        # (1, d_model)
-
-        # frequencies for each pair index: 1 / base^(2i/d_model)
-        pair_i = (i // 2)                                      # (1, d_model) maps 0,0,1,1,2,2...
-        denom = np.power(base, (2.0 * pair_i) / d_model)       # (1, d_model)
-
-        angles = pos / denom                                   # (seq_len, d_model)
-
-        pe = np.zeros_like(angles, dtype=np.float64)
-        pe[:, 0::2] = np.sin(angles[:, 0::2])                  # even dims
-        pe[:, 1::2] = np.cos(angles[:, 1::2])                  # odd dims
-        return pe
-
-    def value_to_color(self, v: float):
-        """
-        Map [-1, 1] -> color. Feel free to change palette.
-        """
-        # Normalize to [0,1]
-        t = (v + 1.0) / 2.0
-        # Interpolate between BLUE (neg) -> WHITE (0) -> RED (pos)
-        if t < 0.5:
-            return interpolate_color(BLUE, WHITE, t / 0.5)
-        else:
-            return interpolate_color(WHITE, RED, (t - 0.5) / 0.5)
-
-    def make_heatmap(self, pe: np.ndarray, cell_size=0.10, stroke=0.0):
-        """
-        Render PE matrix as a VGroup of squares (rows=pos, cols=dim).
-        """
-        rows, cols = pe.shape
-        cells = VGroup()
-        for r in range(rows):
-            for c in range(cols):
-                sq = Square(side_length=cell_size, stroke_width=stroke)
-                sq.set_fill(self.value_to_color(pe[r, c]), opacity=1.0)
-                # Place in grid: top-left origin
-                sq.move_to(np.array([c * cell_size, -r * cell_size, 0.0]))
-                cells.add(sq)
-
-        # Center the whole heatmap
-        cells.move_to(ORIGIN)
-        return cells
+        return Heatmap(pe, cell_size=cell_size)
 
     def make_wave_panel(self, dims_to_show, seq_len, d_model, base=10000.0):
         """
@@ -64,26 +28,18 @@ class PositionalEncodingWavesToHeatmap(Scene):
         )
         ax_labels = ax.get_axis_labels(Tex("pos", font_size=24), Tex("value", font_size=24))
 
-        pe = self.pe_matrix(seq_len, d_model, base=base)
-
-        waves = VGroup()
-        labels = VGroup()
+        pe = pe_matrix(seq_len, d_model, base=base)
 
         colors = [BLUE, GREEN, YELLOW, ORANGE, PURPLE]
-        
-        for idx, dim in enumerate(dims_to_show):
-            # Plot discrete positions as a smooth curve
-            xs = np.arange(seq_len)
-            ys = pe[:, dim]
 
-            graph = ax.plot_line_graph(
-                x_values=xs,
-                y_values=ys,
-                add_vertex_dots=False,
-                stroke_width=3,
-                line_color=colors[idx % len(colors)],
-            )
-            waves.add(graph)
+        # Every selected dimension plotted vs position in one pass; waves[i] is one curve
+        waves = MultiLineGraph(
+            ax,
+            x_values=np.arange(seq_len),
+            y_values=pe[:, dims_to_show].T,
+            colors=colors,
+            stroke_width=3,
+        )
 
         panel = VGroup(ax, ax_labels, waves)
         return panel
@@ -112,13 +68,24 @@ class PositionalEncodingWavesToHeatmap(Scene):
             62, 63     # sin_31, cos_31 (lowest freq)
         ]
 
+        # Axis labels and every sin/cos pair label, compiled in a single LaTeX run
+        with self.span("precompile tex"):
+            precompile_tex(
+                math=[fr"\sin_{{{k}}} \quad \cos_{{{k}}}" for k in sorted({0} | {d // 2 for d in dims_to_show})],
+                text=["pos", "value"],
+            )
+
         # --- Setup: Waves on left, Heatmap on right ---
-        wave_panel = self.make_wave_panel(dims_to_show, seq_len, d_model, base=base)
-        wave_panel.to_edge(LEFT, buff=0.5).shift(UP * 0.5)
+        with self.span("build wave panel"):
+            wave_panel = self.make_wave_panel(dims_to_show, seq_len, d_model, base=base)
+            wave_panel.to_edge(LEFT, buff=0.5).shift(UP * 0.5)
 
-        pe = self.pe_matrix(seq_len, d_model, base=base)
-        heatmap = self.make_heatmap(pe, cell_size=0.085, stroke=0.0)
-        heatmap.to_edge(RIGHT, buff=0.5).shift(UP * 0.5)
+        with self.span("build heatmap"):
+            pe = pe_matrix(seq_len, d_model, base=base)
+            heatmap = self.make_heatmap(pe, cell_size=0.085)
+            heatmap.to_edge(RIGHT, buff=0.5).shift(UP * 0.5)
+            # Added once, fully transparent; columns are swept in as their waves appear
+            heatmap.set_column_alpha(0)
 
         # Extract components for easier access
         ax = wave_panel[0]
@@ -135,13 +102,10 @@ class PositionalEncodingWavesToHeatmap(Scene):
 
         # Build heatmap column by column
         cols = d_model
-        col_groups = []
-        for c in range(cols):
-            col = VGroup(*[heatmap[r * cols + c] for r in range(seq_len)])
-            col_groups.append(col)
 
         # --- Animation: Build waves and heatmap simultaneously ---
         # First show axes
+        self.add(heatmap)
         self.play(
             Create(ax),
             FadeIn(ax_labels),
@@ -172,10 +136,9 @@ class PositionalEncodingWavesToHeatmap(Scene):
             # Prepare animations
             anims = [Create(waves[wave_idx])]
             
-            # Fade in heatmap columns
+            # Sweep in heatmap columns
             if cols_to_show:
-                grp = VGroup(*[col_groups[c] for c in cols_to_show])
-                anims.append(FadeIn(grp, shift=RIGHT * 0.05))
+                anims.append(ColumnSweep(heatmap, cols_to_show[0], cols_to_show[-1] + 1))
             
             # Update label if needed (usually on even dims / new pairs)
             if update_label and dim % 2 == 0:
@@ -250,8 +213,7 @@ class PositionalEncodingWavesToHeatmap(Scene):
                  
                  anims = [Create(waves[wave_idx])]
                  if cols_to_show:
-                     grp = VGroup(*[col_groups[c] for c in cols_to_show])
-                     anims.append(FadeIn(grp, shift=RIGHT * 0.05))
+                     anims.append(ColumnSweep(heatmap, cols_to_show[0], cols_to_show[-1] + 1))
                  
                  if dim % 2 == 0:
                      new_label = make_pair_label(pair_idx)
@@ -273,7 +235,6 @@ class PositionalEncodingWavesToHeatmap(Scene):
         chunk = 2
         for i in range(0, len(remaining_cols), chunk):
             cols_chunk = remaining_cols[i:min(i+chunk, len(remaining_cols))]
-            grp = VGroup(*[col_groups[c] for c in cols_chunk])
-            self.play(FadeIn(grp, shift=RIGHT * 0.05), run_time=0.15)
+            self.play(ColumnSweep(heatmap, cols_chunk[0], cols_chunk[-1] + 1), run_time=0.15)
 
         self.wait(1.5)
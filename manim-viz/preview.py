@@ -0,0 +1,160 @@
+"""
+Keyframe contact sheets for quick review.
+
+Runs each scene's construct with every animation fast-forwarded to its end
+state, like layout_check.py, and rasterizes exactly one frame per play or
+wait: its end state, at a small resolution. The frames are tiled into one
+PNG per scene, media/preview/<Scene>.png, each labelled with the play
+index, the scene time at its end and what was played. Nothing is encoded.
+
+Run with: python preview.py                          (all scenes)
+          python preview.py SelfAttentionAnimation   (one scene)
+          python preview.py --width 640 --columns 3  (bigger tiles)
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+import argparse
+import os
+import time
+
+from render import MEDIA, discover_scenes, load_scene_class
+
+PREVIEW = MEDIA / "preview"
+TILE_WIDTH = 480
+COLUMNS = 4
+LABEL_HEIGHT = 18
+GAP = 4
+
+
+def play_label(scene):
+    """What the last play did, e.g. "Write, FadeIn" or "wait"."""
+    from manim import Wait
+
+    anims = scene.animations or []
+    if anims and all(isinstance(a, Wait) for a in anims):
+        return "wait"
+    names = ", ".join(type(a).__name__ for a in anims)
+    return names if len(names) <= 40 else names[:37] + "..."
+
+
+def contact_sheet(frames, columns, background=(24, 24, 24)):
+    """
+    Tile [(image, label)] into one image, `columns` per row, with the
+    label drawn under each tile.
+    """
+    from PIL import Image, ImageDraw
+
+    w, h = frames[0][0].size
+    rows = -(-len(frames) // columns)
+    cols = min(columns, len(frames))
+    sheet = Image.new(
+        "RGB",
+        (cols * (w + GAP) + GAP, rows * (h + LABEL_HEIGHT + GAP) + GAP),
+        background,
+    )
+    draw = ImageDraw.Draw(sheet)
+    for i, (image, label) in enumerate(frames):
+        x = GAP + (i % columns) * (w + GAP)
+        y = GAP + (i // columns) * (h + LABEL_HEIGHT + GAP)
+        sheet.paste(image, (x, y))
+        draw.text((x + 2, y + h + 3), label, fill=(230, 230, 230))
+    return sheet
+
+
+def preview_scene(path, scene_name, width=TILE_WIDTH, columns=COLUMNS):
+    """
+    Worker: run one scene and write its contact sheet.
+    Returns (scene_name, seconds, plays, sheet path).
+    """
+    from PIL import Image
+    from manim import config, tempconfig
+
+    start = time.perf_counter()
+    scene_cls = load_scene_class(Path(path), scene_name)
+    height = int(round(width * config.frame_height / config.frame_width / 2)) * 2
+    cfg = {
+        "dry_run": True,
+        "disable_caching": True,
+        "media_dir": str(MEDIA / "preview"),
+        "input_file": str(path),
+        "pixel_width": width,
+        "pixel_height": height,
+        "preview": False,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+    }
+    frames = []
+    with tempconfig(cfg):
+        scene = scene_cls(skip_animations=True)
+        renderer = scene.renderer
+        # Skipped plays still paint static mobjects and the final frame; only
+        # the end state of each play is drawn, below
+        update_frame = renderer.update_frame
+        renderer.update_frame = lambda *args, **kwargs: None
+
+        def keyframe(label):
+            renderer.static_image = None
+            update_frame(scene)
+            image = Image.fromarray(renderer.get_frame()).convert("RGB")
+            frames.append((image, f"#{renderer.num_plays - 1}  {renderer.time:6.2f}s  {label}"))
+
+        def previewed_play(play):
+            def wrapper(*args, **kwargs):
+                result = play(*args, **kwargs)
+                keyframe(play_label(scene))
+                return result
+            return wrapper
+
+        scene.play = previewed_play(scene.play)
+        scene.render()
+        plays = renderer.num_plays
+
+    sheet_path = None
+    if frames:
+        PREVIEW.mkdir(parents=True, exist_ok=True)
+        sheet_path = PREVIEW / f"{scene_name}.png"
+        contact_sheet(frames, columns).save(sheet_path)
+    return scene_name, time.perf_counter() - start, plays, sheet_path
+
+
+def preview_all(scene_names=None, jobs=None, width=TILE_WIDTH, columns=COLUMNS):
+    scenes = discover_scenes()
+    if scene_names:
+        missing = [s for s in scene_names if s not in scenes]
+        if missing:
+            raise SystemExit(f"Unknown scene(s): {', '.join(missing)}")
+        scenes = {s: scenes[s] for s in scene_names}
+
+    start = time.perf_counter()
+    jobs = jobs or min(os.cpu_count() or 1, len(scenes))
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(preview_scene, str(path), name, width, columns)
+            for name, path in scenes.items()
+        ]
+        for future in as_completed(futures):
+            name, *rest = future.result()
+            results[name] = rest
+
+    for name in scenes:
+        seconds, plays, sheet_path = results[name]
+        where = sheet_path.relative_to(MEDIA.parent) if sheet_path else "no plays"
+        print(f"{name:<36} {plays:4d} plays {seconds:6.2f}s  {where}")
+    print(f"Previewed {len(scenes)} scene(s) in {time.perf_counter() - start:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--width", type=int, default=TILE_WIDTH, help="tile width in pixels")
+    parser.add_argument("--columns", type=int, default=COLUMNS, help="tiles per row")
+    args = parser.parse_args()
+
+    preview_all(args.scenes, jobs=args.jobs, width=args.width, columns=args.columns)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Drop-in Scene base class that records where render time goes.
+
+Subclass ProfiledScene instead of Scene. construct, every self.play and
+self.wait, and any block wrapped in `with self.span("name"):` are recorded
+as spans with their duration, the number of animated submobjects and the
+frames produced. After rendering, the spans are written as a Chrome trace
+(media/traces/<Scene>.json) that opens in chrome://tracing or Perfetto,
+and the slowest spans are logged.
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+import json
+import os
+import time
+
+from manim import Scene, Wait, config, logger
+from manim.animation.animation import Animation, prepare_animation
+from manim.mobject.mobject import _AnimationBuilder
+
+
+class ProfiledScene(Scene):
+    # Number of slowest spans logged after render
+    profile_top_n = 8
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.spans = []
+        self._t0 = time.perf_counter()
+        self._frames = 0
+
+        # Count frames actually handed to the file writer
+        add_frame = self.renderer.add_frame
+
+        def counting_add_frame(frame, num_frames=1):
+            if not self.renderer.skip_animations:
+                self._frames += num_frames
+            return add_frame(frame, num_frames)
+
+        self.renderer.add_frame = counting_add_frame
+
+    @contextmanager
+    def span(self, name, cat="build", **args):
+        """Record the enclosed block as one span."""
+        start = time.perf_counter()
+        frames = self._frames
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            args.setdefault("frames", self._frames - frames)
+            self.spans.append({
+                "name": name,
+                "cat": cat,
+                "start": start - self._t0,
+                "dur": end - start,
+                "args": args,
+            })
+
+    def play(self, *args, **kwargs):
+        anims = [
+            prepare_animation(a) if isinstance(a, (Animation, _AnimationBuilder)) else a
+            for a in args
+        ]
+        submobjects = sum(
+            len(a.mobject.get_family())
+            for a in anims
+            if isinstance(a, Animation) and a.mobject is not None
+        )
+        if anims and all(isinstance(a, Wait) for a in anims):
+            name, cat = "wait", "wait"
+        else:
+            name, cat = "play: " + ", ".join(type(a).__name__ for a in anims), "play"
+
+        with self.span(name, cat, submobjects=submobjects, index=self.renderer.num_plays):
+            super().play(*anims, **kwargs)
+
+    def render(self, preview=False):
+        construct = self.construct
+
+        def profiled_construct():
+            with self.span("construct", "construct"):
+                construct()
+
+        self.construct = profiled_construct
+        try:
+            with self.span("render", "render"):
+                return super().render(preview)
+        finally:
+            self.construct = construct
+            if self.spans:
+                self.export_chrome_trace()
+                self.log_profile()
+
+    def export_chrome_trace(self, path=None):
+        """Write spans in Chrome trace-event format. Returns the path."""
+        if path is None:
+            path = Path(config.media_dir) / "traces" / f"{type(self).__name__}.json"
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        pid = os.getpid()
+        events = [
+            {
+                "name": s["name"],
+                "cat": s["cat"],
+                "ph": "X",
+                "ts": round(s["start"] * 1e6, 1),
+                "dur": round(s["dur"] * 1e6, 1),
+                "pid": pid,
+                "tid": 1,
+                "args": s["args"],
+            }
+            for s in self.spans
+        ]
+        path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+        logger.info("Chrome trace written to %s", path)
+        return path
+
+    def log_profile(self):
+        leaf = [s for s in self.spans if s["cat"] not in ("render", "construct")]
+        for s in sorted(leaf, key=lambda s: s["dur"], reverse=True)[: self.profile_top_n]:
+            logger.info(
+                "%7.3fs  %-48s submobjects=%s frames=%s",
+                s["dur"], s["name"][:48], s["args"].get("submobjects", "-"), s["args"]["frames"],
+            )
@@ -0,0 +1,562 @@
+"""
+Render every manim-viz scene in parallel and copy the results to the paths
+the blog posts reference under static/.
+
+Scenes are fingerprinted from their source, the local helper modules they
+import, the output pipeline modules in PIPELINE, the data files they declare
+in an `inputs` class attribute, their render settings and the manim version.
+A scene whose fingerprint already has an output in .render-cache/ is not
+rendered again; .render-cache/manifest.json records why each scene was last
+rebuilt.
+
+Run with: python render.py                  (all scenes)
+          python render.py TokenizationFlow  (selected scenes)
+          python render.py --force           (ignore the cache)
+          python render.py --assets          (also write web variants, see assets.py)
+          python render.py --list            (show discovered scenes)
+          python render.py SelfAttentionAnimation --set query=river
+                                             (override a scene class attribute)
+
+Renders with --set overrides are cached under their own fingerprint and
+stay in media/; the published assets always come from the defaults.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+import argparse
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import time
+
+HERE = Path(__file__).resolve().parent
+STATIC = HERE.parent / "static"
+MEDIA = HERE / "media"
+CACHE = HERE / ".render-cache"
+MANIFEST = CACHE / "manifest.json"
+
+# Modules that turn any scene into its published files; part of every fingerprint
+PIPELINE = ("render.py", "animated_image.py", "hold_frames.py", "assets.py")
+
+# Per-scene render settings. "format" is one of mp4 / gif / webp / png (last frame).
+# gif and webp go through animated_image.AnimatedImageWriter unless "encoder" is "manim".
+SCENES = {
+    "TokenizationFlow": {
+        "quality": "high_quality",
+        "format": "gif",
+        "encoder": "direct",
+        "output": "img/positional-encoding/tokenization.gif",
+    },
+    "EmbeddingFlow": {
+        "quality": "low_quality",
+        "format": "gif",
+        "encoder": "direct",
+        "output": "img/positional-encoding/embedding.gif",
+    },
+    "SimplePositionEncoding": {
+        "quality": "low_quality",
+        "format": "gif",
+        "encoder": "direct",
+        "output": "img/positional-encoding/simple_position.gif",
+    },
+    "PositionalEncodingVectorAdd": {
+        "quality": "high_quality",
+        "format": "png",
+        "output": "img/positional-encoding/PositionalEncodingVectorAdd_ManimCE_v0.19.1.png",
+    },
+    "PositionalEncodingWavesToHeatmap": {
+        "quality": "high_quality",
+        "format": "mp4",
+        "output": "video/positional-encoding/PositionalEncodingWavesToHeatmap.mp4",
+    },
+    "AttentionBankVisualization": {
+        "quality": "low_quality",
+        "format": "gif",
+        "encoder": "direct",
+        "output": "img/attention/attention.gif",
+    },
+    "Word2VecAnalogy": {
+        "quality": "high_quality",
+        "format": "mp4",
+        "output": "video/attention/Word2VecAnalogy.mp4",
+    },
+    "SelfAttentionAnimation": {
+        "quality": "high_quality",
+        "format": "mp4",
+        "output": "video/attention/SelfAttentionAnimation.mp4",
+    },
+}
+
+# Scenes found on disk but missing above stay in media/ only
+DEFAULT_SETTINGS = {"quality": "low_quality", "format": "mp4", "output": None}
+
+
+def discover_scenes(directory=HERE):
+    """
+    Find Scene subclasses by parsing the files, without importing manim.
+    Returns {scene_name: path}. A class is a scene if a base class name ends
+    in "Scene" or is itself a scene found here, in any file, so subclasses
+    of concrete scenes (SelfAttentionLongSequence) are picked up too.
+    Classes that neither define nor inherit a construct of ours
+    (ProfiledScene, BackgroundCacheScene) are bases, not scenes, and are
+    skipped.
+    """
+    classes = {}
+    for path in sorted(directory.glob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                bases = [b.attr if isinstance(b, ast.Attribute) else getattr(b, "id", "") for b in node.bases]
+                classes[node.name] = (path, bases, _defines_construct(node))
+
+    # Grow both sets until no class changes, so base order across files doesn't matter
+    scenes, concrete = set(), set()
+    changed = True
+    while changed:
+        changed = False
+        for name, (_, bases, construct) in classes.items():
+            if name not in scenes and any(b.endswith("Scene") or b in scenes for b in bases):
+                scenes.add(name)
+                changed = True
+            if name in scenes and name not in concrete and (construct or any(b in concrete for b in bases)):
+                concrete.add(name)
+                changed = True
+    return {name: path for name, (path, _, _) in classes.items() if name in concrete}
+
+
+def _defines_construct(node):
+    return any(
+        isinstance(item, ast.FunctionDef) and item.name == "construct" for item in node.body
+    )
+
+
+def local_imports(path, directory=HERE):
+    """
+    Files in this folder that `path` imports, directly or through other
+    helpers, including `path` itself. Returns sorted paths.
+    """
+    seen = set()
+    todo = [Path(path)]
+    while todo:
+        current = todo.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        tree = ast.parse(current.read_text(encoding="utf-8"), filename=str(current))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                helper = directory / (name.split(".")[0] + ".py")
+                if helper.exists():
+                    todo.append(helper)
+    return sorted(seen)
+
+
+def declared_inputs(scene_name, directory=HERE):
+    """
+    Data paths (relative to this folder) a scene reads while rendering, from
+    an `inputs = ("data/...", ...)` tuple literal in its class body or in a
+    base class's. Without importing manim, like discover_scenes.
+    """
+    classes = {}
+    for path in sorted(directory.glob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                classes[node.name] = node
+
+    found = []
+    todo = [scene_name]
+    while todo:
+        node = classes.get(todo.pop())
+        if node is None:
+            continue
+        for item in node.body:
+            if (isinstance(item, ast.Assign) and len(item.targets) == 1
+                    and getattr(item.targets[0], "id", None) == "inputs"):
+                found.extend(p for p in ast.literal_eval(item.value) if p not in found)
+        todo.extend(getattr(b, "id", "") for b in node.bases)
+    return found
+
+
+def data_digest(path):
+    """
+    Digest of a data file or folder, or "missing". Files over 64 MB (word
+    vectors) are identified by size and mtime instead of being read.
+    """
+    path = Path(path)
+    if path.is_dir():
+        files = sorted(p for p in path.rglob("*") if p.is_file())
+        listing = "\n".join(f"{p.relative_to(path)} {data_digest(p)}" for p in files)
+        return hashlib.sha256(listing.encode()).hexdigest()
+    if not path.exists():
+        return "missing"
+    stat = path.stat()
+    if stat.st_size > 64 * 2**20:
+        return f"size {stat.st_size} mtime {stat.st_mtime_ns}"
+    return file_digest(path)
+
+
+def manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def file_digest(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def fingerprint(path, settings, version, scene_name=None):
+    """
+    Hash of everything that affects a scene's output.
+    Returns (hash, inputs) where inputs maps each source file, each PIPELINE
+    module, and each data path the scene declares in `inputs`, to its digest.
+    """
+    inputs = {p.name: file_digest(p) for p in local_imports(path)}
+    for name in PIPELINE:
+        inputs[name] = file_digest(Path(path).parent / name)
+    if scene_name:
+        for name in declared_inputs(scene_name, Path(path).parent):
+            inputs[name] = data_digest(Path(path).parent / name)
+    payload = json.dumps(
+        {"inputs": inputs, "settings": settings, "manim": version},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16], inputs
+
+
+def rebuild_reason(scene_path, previous, inputs, settings, version):
+    """Human-readable explanation of why a scene's fingerprint changed."""
+    if not previous:
+        return "first build"
+    reasons = []
+    if previous.get("manim") != version:
+        reasons.append(f"manim {previous.get('manim')} -> {version}")
+    for key in sorted(set(settings) | set(previous.get("settings", {}))):
+        old, new = previous.get("settings", {}).get(key), settings.get(key)
+        if old != new:
+            reasons.append(f"{key} {old} -> {new}")
+    old_inputs = previous.get("inputs", {})
+    for name in sorted(set(inputs) | set(old_inputs)):
+        role = ("source" if name == scene_path.name else "data" if "/" in name
+                else "pipeline" if name in PIPELINE else "helper")
+        if name not in old_inputs:
+            reasons.append(f"{role} {name} added")
+        elif name not in inputs:
+            reasons.append(f"{role} {name} removed")
+        elif old_inputs[name] != inputs[name]:
+            reasons.append(f"{role} {name} changed")
+    return "; ".join(reasons) or "cached output missing"
+
+
+def load_manifest():
+    try:
+        return json.loads(MANIFEST.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest):
+    CACHE.mkdir(parents=True, exist_ok=True)
+    MANIFEST.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def cached_output(scene_name, digest, settings):
+    return CACHE / scene_name / f"{digest}.{settings['format']}"
+
+
+def publish(source, settings):
+    """Copy a rendered file to its static/ destination, skipping identical copies."""
+    if not settings["output"]:
+        return source
+    dest = STATIC / settings["output"]
+    if dest.exists() and dest.stat().st_size == source.stat().st_size and file_digest(dest) == file_digest(source):
+        return dest
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(source, dest)
+    return dest
+
+
+def parse_params(items):
+    """
+    --set values as {scene or "*": {attribute: value}}. Items are
+    NAME=VALUE or Scene.NAME=VALUE; values are Python literals where they
+    parse (3, "a b", ["x", "y"]) and plain strings otherwise.
+    """
+    params = {}
+    for item in items or ():
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            raise SystemExit(f"--set expects NAME=VALUE, got {item!r}")
+        try:
+            value = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            pass
+        scene, _, attr = key.rpartition(".")
+        params.setdefault(scene or "*", {})[attr] = value
+    return params
+
+
+def settings_for(scene_name, quality=None, encoder=None, params=None):
+    settings = dict(SCENES.get(scene_name, DEFAULT_SETTINGS))
+    if quality:
+        settings["quality"] = quality
+    if encoder and settings["format"] in ("gif", "webp"):
+        settings["encoder"] = encoder
+    params = params or {}
+    overrides = {**params.get("*", {}), **params.get(scene_name, {})}
+    if overrides:
+        # Part of the fingerprint; a variant never replaces the published asset
+        settings["params"] = overrides
+        settings["output"] = None
+    return settings
+
+
+def load_scene_class(path, scene_name):
+    """Import a scene file the way the manim CLI does (its folder on sys.path)."""
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[path.stem] = module
+    spec.loader.exec_module(module)
+    return getattr(module, scene_name)
+
+
+def direct_encoding(settings):
+    """Whether frames bypass manim's movie writer for our GIF/WebP encoder."""
+    return settings["format"] in ("gif", "webp") and settings.get("encoder", "direct") == "direct"
+
+
+def manim_config(path, scene_name, settings):
+    """tempconfig overrides for one scene."""
+    cfg = {
+        "quality": settings["quality"],
+        "media_dir": str(MEDIA),
+        "input_file": str(path),
+        "output_file": scene_name,
+        "preview": False,
+        "progress_bar": "none",
+    }
+    if settings["format"] == "png":
+        cfg.update({"save_last_frame": True, "write_to_movie": False})
+    elif direct_encoding(settings):
+        # Frames are taken from write_frame; manim writes nothing itself
+        cfg.update({"write_to_movie": False})
+    else:
+        cfg.update({"format": settings["format"], "write_to_movie": True})
+    return cfg
+
+
+def rendered_file(scene, settings):
+    """Where manim wrote the result for this scene."""
+    writer = scene.renderer.file_writer
+    if settings["format"] == "png":
+        return Path(writer.image_file_path)
+    if settings["format"] == "gif":
+        return Path(writer.gif_file_path)
+    return Path(writer.movie_file_path)
+
+
+def format_size(n):
+    return f"{n / 1e6:.2f} MB" if n >= 1e5 else f"{n / 1e3:.1f} kB"
+
+
+def new_scene(scene_cls, fmt):
+    """The scene, with the file writer this pipeline uses for fmt."""
+    if fmt == "mp4":
+        from manim.renderer.cairo_renderer import CairoRenderer
+        from hold_frames import HoldFrameFileWriter
+
+        # Static holds are encoded once instead of once per frame
+        return scene_cls(renderer=CairoRenderer(file_writer_class=HoldFrameFileWriter))
+    return scene_cls()
+
+
+def render_one(path, scene_name, settings):
+    """
+    Worker: render a single scene in this process.
+    Returns (scene_name, seconds, rendered file, note).
+    """
+    from manim import config, tempconfig
+
+    start = time.perf_counter()
+    scene_cls = load_scene_class(Path(path), scene_name)
+    note = ""
+    for attr, value in settings.get("params", {}).items():
+        if hasattr(scene_cls, attr):
+            setattr(scene_cls, attr, value)
+        else:
+            note += f"no attribute {attr!r}, --set ignored; "
+    with tempconfig(manim_config(Path(path), scene_name, settings)):
+        scene = new_scene(scene_cls, settings["format"])
+        if direct_encoding(settings):
+            from animated_image import AnimatedImageWriter
+
+            writer = AnimatedImageWriter(
+                MEDIA / "animated" / f"{scene_name}.{settings['format']}",
+                fps=config.frame_rate,
+                colors=getattr(scene_cls, "palette", None),
+            )
+            scene.renderer.file_writer.write_frame = writer.write_frame
+            scene.render()
+            stats = writer.close()
+            result = stats["path"]
+
+            # Compare with the asset currently published (made by the previous path)
+            current = STATIC / settings["output"] if settings["output"] else None
+            note += (
+                f"{settings['format']} {format_size(stats['bytes'])}, "
+                f"{stats['frames_out']}/{stats['frames_in']} frames, encode {stats['seconds']:.1f}s"
+            )
+            if current and current.exists():
+                note += f"; current {current.relative_to(STATIC)} {format_size(current.stat().st_size)}"
+        else:
+            scene.render()
+            result = rendered_file(scene, settings)
+            writer = scene.renderer.file_writer
+            if settings["format"] == "mp4":
+                note += f"mp4 {writer.frames_encoded}/{writer.frames_in} frames encoded"
+    return scene_name, time.perf_counter() - start, str(result), note
+
+
+def render_all(scene_names=None, quality=None, jobs=None, force=False, encoder=None, assets=False,
+               params=None):
+    scenes = discover_scenes()
+    if scene_names:
+        missing = [s for s in scene_names if s not in scenes]
+        if missing:
+            raise SystemExit(f"Unknown scene(s): {', '.join(missing)}")
+        scenes = {s: scenes[s] for s in scene_names}
+
+    start = time.perf_counter()
+    version = manim_version()
+    manifest = load_manifest()
+
+    # Split into cache hits and scenes that need a render
+    todo = {}
+    results = []
+    failures = []
+    for name, path in scenes.items():
+        settings = settings_for(name, quality, encoder, params)
+        digest, inputs = fingerprint(path, settings, version, name)
+        cached = cached_output(name, digest, settings)
+        if cached.exists() and not force:
+            dest = publish(cached, settings)
+            print(f"  {name:<36} {'cached':>8}  -> {dest}")
+            results.append((name, 0.0, dest))
+            continue
+        reason = "forced" if force else rebuild_reason(path, manifest.get(name), inputs, settings, version)
+        todo[name] = (path, settings, digest, inputs, reason)
+
+    if todo:
+        jobs = jobs or min(os.cpu_count() or 1, len(todo))
+        print(f"Rendering {len(todo)} scene(s) with {jobs} worker(s)")
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                pool.submit(render_one, str(path), name, settings): name
+                for name, (path, settings, *_) in todo.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                path, settings, digest, inputs, reason = todo[name]
+                try:
+                    name, seconds, rendered, note = future.result()
+                    cached = cached_output(name, digest, settings)
+                    cached.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(rendered, cached)
+                    dest = publish(cached, settings)
+                except Exception as err:
+                    # Keep the other scenes going; the run fails at the end
+                    error = f"{type(err).__name__}: {err}"
+                    failures.append((name, error))
+                    manifest[name] = {
+                        **manifest.get(name, {}),
+                        "failed": error,
+                        "failed_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    }
+                    save_manifest(manifest)
+                    print(f"  {name:<36} {'FAILED':>8}  {error}")
+                    continue
+
+                manifest[name] = {
+                    "hash": digest,
+                    "source": path.name,
+                    "inputs": inputs,
+                    "settings": settings,
+                    "manim": version,
+                    "output": str(dest),
+                    "reason": reason,
+                    "seconds": round(seconds, 2),
+                    "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                }
+                save_manifest(manifest)
+                print(f"  {name:<36} {seconds:7.1f}s  -> {dest}  ({reason})")
+                if note:
+                    print(f"  {'':<36} {note}")
+                results.append((name, seconds, dest))
+
+    if assets:
+        build_web_assets([Path(dest) for _, _, dest in results], force=force)
+
+    total = time.perf_counter() - start
+    slowest = max((s for _, s, _ in results), default=0.0)
+    print(f"Done in {total:.1f}s (slowest scene {slowest:.1f}s)")
+    if failures:
+        for name, error in failures:
+            print(f"  failed: {name}: {error}")
+        raise SystemExit(f"{len(failures)} of {len(scenes)} scene(s) failed")
+    return results
+
+
+def build_web_assets(published, force=False):
+    """Responsive variants and shortcode snippets for published animations (see assets.py)."""
+    from assets import assets_stale, build_assets, print_result
+
+    for dest in published:
+        if dest.suffix not in (".mp4", ".gif") or not dest.is_relative_to(STATIC):
+            continue
+        if force or assets_stale(dest):
+            print_result(dest, build_assets(dest))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: all)")
+    parser.add_argument("-q", "--quality", help="override quality for every scene, e.g. low_quality")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="render even when the cache is up to date")
+    parser.add_argument("--encoder", choices=["direct", "manim"],
+                        help="GIF/WebP encoder: our palette encoder (default) or manim's own")
+    parser.add_argument("--assets", action="store_true",
+                        help="also write web variants (small MP4s, WebP, poster) of published animations")
+    parser.add_argument("--set", action="append", metavar="[SCENE.]NAME=VALUE",
+                        help="override a scene class attribute, e.g. query=river (repeatable)")
+    parser.add_argument("--list", action="store_true", help="list discovered scenes and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, path in discover_scenes().items():
+            settings = settings_for(name)
+            print(f"{name:<36} {path.name:<38} {settings['quality']:<14} {settings['format']:<4} {settings['output']}")
+        return
+
+    render_all(args.scenes, quality=args.quality, jobs=args.jobs, force=args.force, encoder=args.encoder,
+               assets=args.assets, params=parse_params(args.set))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,6 @@ Run with: manim -pql --format gif simple_position.py SimplePositionEncoding
 
 from manim import (
     Scene,
-    Text,
     VGroup,
     RoundedRectangle,
     FadeIn,
@@ -19,13 +18,20 @@ from manim import (
     WHITE,
 )
 
+from text_cache import cached_text, log_text_cache_stats
+
+
+# Colors
+VEC_COLOR = "#64b5f6"       # Blue
+POS_COLOR = "#ff8a65"       # Coral/Orange
+RESULT_COLOR = "#81c784"    # Green
+
 
 class SimplePositionEncoding(Scene):
+    # Colors the direct GIF/WebP encoder builds its palette from
+    palette = [VEC_COLOR, POS_COLOR, RESULT_COLOR, GRAY, WHITE]
+
     def construct(self):
-        # Colors
-        VEC_COLOR = "#64b5f6"       # Blue
-        POS_COLOR = "#ff8a65"       # Coral/Orange
-        
         words = ["I", "love", "transformers"]
         
         # Row 1: Word embedding vectors
@@ -42,24 +48,24 @@ class SimplePositionEncoding(Scene):
             )
             # Show some fake embedding values
             vals = VGroup(
-                Text("0.3", font_size=16, color=WHITE),
-                Text("-0.7", font_size=16, color=WHITE),
-                Text("0.2", font_size=16, color=WHITE),
-                Text("...", font_size=16, color=GRAY),
+                cached_text("0.3", font_size=16, color=WHITE),
+                cached_text("-0.7", font_size=16, color=WHITE),
+                cached_text("0.2", font_size=16, color=WHITE),
+                cached_text("...", font_size=16, color=GRAY),
             ).arrange(DOWN, buff=0.08)
             vals.move_to(vec_box.get_center())
             
-            word_label = Text(f'"{word}"', font_size=18, color=GRAY)
+            word_label = cached_text(f'"{word}"', font_size=18, color=GRAY)
             word_label.next_to(vec_box, UP, buff=0.15)
             
             embed_row.add(VGroup(vec_box, vals, word_label))
         
         embed_row.arrange(RIGHT, buff=0.5)
-        embed_label = Text("Word Embeddings", font_size=20, color=VEC_COLOR)
+        embed_label = cached_text("Word Embeddings", font_size=20, color=VEC_COLOR)
         embed_label.next_to(embed_row, LEFT, buff=0.4)
         
         # Plus sign
-        plus = Text("+", font_size=40, color=WHITE)
+        plus = cached_text("+", font_size=40, color=WHITE)
         
         # Row 2: Position vectors
         pos_row = VGroup()
@@ -75,23 +81,22 @@ class SimplePositionEncoding(Scene):
             )
             # Position values (all same digit)
             vals = VGroup(
-                Text(str(i), font_size=16, color=WHITE),
-                Text(str(i), font_size=16, color=WHITE),
-                Text(str(i), font_size=16, color=WHITE),
-                Text("...", font_size=16, color=GRAY),
+                cached_text(str(i), font_size=16, color=WHITE),
+                cached_text(str(i), font_size=16, color=WHITE),
+                cached_text(str(i), font_size=16, color=WHITE),
+                cached_text("...", font_size=16, color=GRAY),
             ).arrange(DOWN, buff=0.08)
             vals.move_to(vec_box.get_center())
             
             pos_row.add(VGroup(vec_box, vals))
         
         pos_row.arrange(RIGHT, buff=0.5)
-        pos_label = Text("Position Vectors", font_size=20, color=POS_COLOR)
+        pos_label = cached_text("Position Vectors", font_size=20, color=POS_COLOR)
         
         # Equals sign
-        equals = Text("=", font_size=40, color=WHITE)
+        equals = cached_text("=", font_size=40, color=WHITE)
         
         # Row 3: Result vectors (position-encoded embeddings)
-        RESULT_COLOR = "#81c784"  # Green
         result_row = VGroup()
         result_vals = [
             ["0.3", "-0.7", "0.2"],   # 0 + embed
@@ -109,20 +114,20 @@ class SimplePositionEncoding(Scene):
                 fill_opacity=0.15
             )
             vals = VGroup(
-                Text(result_vals[i][0], font_size=16, color=WHITE),
-                Text(result_vals[i][1], font_size=16, color=WHITE),
-                Text(result_vals[i][2], font_size=16, color=WHITE),
-                Text("...", font_size=16, color=GRAY),
+                cached_text(result_vals[i][0], font_size=16, color=WHITE),
+                cached_text(result_vals[i][1], font_size=16, color=WHITE),
+                cached_text(result_vals[i][2], font_size=16, color=WHITE),
+                cached_text("...", font_size=16, color=GRAY),
             ).arrange(DOWN, buff=0.08)
             vals.move_to(vec_box.get_center())
             
-            word_label = Text(f'"{word}"', font_size=18, color=GRAY)
+            word_label = cached_text(f'"{word}"', font_size=18, color=GRAY)
             word_label.next_to(vec_box, UP, buff=0.15)
             
             result_row.add(VGroup(vec_box, vals, word_label))
         
         result_row.arrange(RIGHT, buff=0.5)
-        result_label = Text("Position-Encoded Word Vectors", font_size=20, color=RESULT_COLOR)
+        result_label = cached_text("Position-Encoded Word Vectors", font_size=20, color=RESULT_COLOR)
         
         # Create left side (embed + pos) and right side (result)
         left_group = VGroup()
@@ -148,3 +153,4 @@ class SimplePositionEncoding(Scene):
         self.play(Write(equals), run_time=0.3)
         self.play(FadeIn(result_row), FadeIn(result_label), run_time=0.6)
         self.wait(1.5)
+        log_text_cache_stats(type(self).__name__)
@@ -0,0 +1,153 @@
+"""
+Compile all of a scene's MathTex/Tex strings in one LaTeX run.
+
+MathTex normally runs latex + dvisvgm once per expression. precompile_tex
+puts every expression on its own page of a single document, converts all
+pages with one dvisvgm call, and drops each page's SVG where manim's
+tex_to_svg_file looks for it. The MathTex/Tex calls made afterwards find
+their SVG already on disk and skip compilation.
+
+Usage, at the top of construct:
+
+    precompile_tex(math=[r"\\sin", r"\\cos", *[fr"e_{{{i}}}" for i in range(8)]])
+"""
+
+from pathlib import Path
+import os
+import subprocess
+import time
+
+from manim import MathTex, Tex, config, logger
+from manim.utils.tex_file_writing import generate_tex_file, make_tex_compilation_command
+
+DEFAULT_DOCUMENTCLASS = r"\documentclass[preview]{standalone}"
+
+# LaTeX specials in text mode, e.g. for a vocabulary word inside \text{...}
+_TEX_ESCAPES = {
+    "\\": r"\textbackslash{}", "&": r"\&", "%": r"\%", "$": r"\$", "#": r"\#",
+    "_": r"\_", "{": r"\{", "}": r"\}", "~": r"\textasciitilde{}", "^": r"\textasciicircum{}",
+}
+
+
+def escape_tex(text):
+    """text with LaTeX special characters escaped, for use in text mode."""
+    return "".join(_TEX_ESCAPES.get(c, c) for c in str(text))
+
+
+def _expressions(mob_class, tex_strings):
+    """
+    The exact expressions (whole string + each part) a MathTex/Tex built
+    from tex_strings will ask tex_to_svg_file for.
+    """
+    # Borrow the class's own string handling without running __init__
+    probe = mob_class.__new__(mob_class)
+    probe.substrings_to_isolate = []
+    probe.tex_to_color_map = {}
+    separator = " " if mob_class is MathTex else ""
+    parts = probe._break_up_tex_strings(tex_strings)
+    return [probe._get_modified_expression(s) for s in [separator.join(parts), *parts]]
+
+
+def _requests(math, text):
+    """(expression, environment) pairs, de-duplicated, in first-seen order."""
+    seen = {}
+    for mob_class, environment, items in ((MathTex, "align*", math), (Tex, "center", text)):
+        for item in items:
+            tex_strings = (item,) if isinstance(item, str) else tuple(item)
+            for expression in _expressions(mob_class, tex_strings):
+                seen.setdefault((expression, environment), None)
+    return list(seen)
+
+
+def _batch_document(pages, tex_template):
+    """
+    One document with a page per expression. The preview package with
+    tightpage crops every page to its content, like the standalone class
+    manim uses for a single expression.
+    """
+    body = []
+    for expression, environment in pages:
+        single = tex_template.get_texcode_for_expression_in_env(expression, environment)
+        inner = single.split(r"\begin{document}", 1)[1].rsplit(r"\end{document}", 1)[0]
+        body.append("\\begin{preview}\n" + inner.strip() + "\n\\end{preview}")
+    return "\n".join([
+        r"\documentclass{article}",
+        tex_template.preamble,
+        r"\usepackage[active,tightpage]{preview}",
+        r"\pagestyle{empty}",
+        r"\begin{document}",
+        *body,
+        r"\end{document}",
+    ])
+
+
+def precompile_tex(math=(), text=(), tex_template=None):
+    """
+    Compile every MathTex (math) and Tex (text) string in one LaTeX pass.
+    Items are strings or tuples of strings (the positional args of MathTex/Tex).
+    Returns the number of expressions compiled; already-cached ones are skipped.
+    Any failure is logged and left to MathTex/Tex to compile one by one.
+    """
+    tex_template = tex_template or config["tex_template"]
+    if tex_template.documentclass != DEFAULT_DOCUMENTCLASS or tex_template._body:
+        # Custom templates may depend on the standalone class; leave them alone
+        return 0
+
+    # Target SVG for every expression that is not compiled yet
+    pending = []
+    for expression, environment in _requests(math, text):
+        svg = generate_tex_file(expression, environment, tex_template).with_suffix(".svg")
+        if not svg.exists():
+            pending.append((expression, environment, svg))
+    if not pending:
+        return 0
+
+    start = time.perf_counter()
+    tex_dir = Path(config.get_dir("tex_dir"))
+    batch = tex_dir / f"batch_{os.getpid()}.tex"
+    batch.write_text(_batch_document([p[:2] for p in pending], tex_template), encoding="utf-8")
+
+    output_format = tex_template.output_format
+    command = make_tex_compilation_command(
+        tex_template.tex_compiler, output_format, batch, tex_dir
+    )
+    try:
+        if subprocess.run(command, stdout=subprocess.DEVNULL).returncode != 0:
+            logger.warning("Batched TeX compilation failed, see %s", batch.with_suffix(".log"))
+            return 0
+
+        # One dvisvgm call for all pages, written as <batch>-0001.svg, ...
+        subprocess.run(
+            [
+                "dvisvgm",
+                *(["--pdf"] if output_format == ".pdf" else []),
+                f"--page=1-{len(pending)}",
+                "--no-fonts",
+                "--verbosity=0",
+                f"--output={batch.with_suffix('').as_posix()}-%4p.svg",
+                batch.with_suffix(output_format).as_posix(),
+            ],
+            stdout=subprocess.DEVNULL,
+        )
+    except FileNotFoundError as err:
+        logger.warning("Batched TeX compilation skipped: %s", err)
+        return 0
+
+    compiled = 0
+    for page, (expression, _, svg) in enumerate(pending, start=1):
+        page_svg = tex_dir / f"{batch.stem}-{page:04d}.svg"
+        if page_svg.exists():
+            page_svg.replace(svg)
+            compiled += 1
+        else:
+            logger.warning("Batched TeX produced no page for %r", expression)
+
+    for pattern in (f"{batch.stem}.*", f"{batch.stem}-*.svg"):
+        for leftover in tex_dir.glob(pattern):
+            leftover.unlink()
+
+    logger.info(
+        "Compiled %d TeX expressions in one pass (%.2fs)",
+        compiled, time.perf_counter() - start,
+    )
+    return compiled
@@ -0,0 +1,59 @@
+"""
+Memoized Text factory.
+
+Every Text goes through Pango and SVG parsing. cached_text builds each
+(string, font, size, weight, slant) once per process and hands out copies,
+coloring them afterwards so the color is not part of the cache key.
+"""
+
+from manim import Text, WHITE, NORMAL, DEFAULT_FONT_SIZE, logger
+
+_templates = {}
+_hits = 0
+_misses = 0
+
+
+def cached_text(text: str, font_size=DEFAULT_FONT_SIZE, color=WHITE, font="",
+                weight=NORMAL, slant=NORMAL):
+    """
+    Drop-in for Text(text, font_size=..., color=..., font=..., weight=...).
+    """
+    global _hits, _misses
+
+    key = (text, font, float(font_size), weight, slant)
+    template = _templates.get(key)
+    if template is None:
+        _misses += 1
+        template = Text(text, font_size=font_size, font=font, weight=weight, slant=slant)
+        _templates[key] = template
+    else:
+        _hits += 1
+    return template.copy().set_color(color)
+
+
+def text_cache_stats():
+    total = _hits + _misses
+    return {
+        "hits": _hits,
+        "misses": _misses,
+        "hit_rate": _hits / total if total else 0.0,
+        "templates": len(_templates),
+    }
+
+
+def log_text_cache_stats(scene_name: str):
+    """
+    Log the hit rate since the last call and reset the counters.
+    Call at the end of a scene's construct to get per-scene numbers;
+    templates stay cached for the next scene in the same process.
+    """
+    global _hits, _misses
+
+    stats = text_cache_stats()
+    logger.info(
+        "Text cache for %s: %d hits / %d misses (%.0f%% hit rate, %d templates)",
+        scene_name, stats["hits"], stats["misses"], 100 * stats["hit_rate"], stats["templates"],
+    )
+    _hits = 0
+    _misses = 0
+    return stats
@@ -2,11 +2,15 @@
 Tokenization Visualization - Sentence to Token IDs to Input Embedding
 Run with: manim -pqh tokenization.py TokenizationFlow
 For video: manim -pqh --format mp4 tokenization.py TokenizationFlow
+
+The token IDs come from bpe.py and the vocabulary in data/bpe/: GPT-2's
+files, or one trained on the blog posts with `python bpe.py --train`. On a
+fresh checkout, with no data/bpe/, the same vocabulary is trained on the
+posts in memory (nothing is written). The log says which one was used.
 """
 
 from manim import (
     Scene,
-    Text,
     Table,
     VGroup,
     RoundedRectangle,
@@ -21,41 +25,72 @@ from manim import (
     ORIGIN,
     BOLD,
     GRAY,
+    WHITE,
+    config,
+    logger,
 )
 
+from bpe import DATA, POSTS, corpus, load, train
+from components import make_token_array
+from text_cache import cached_text, log_text_cache_stats
+
+
+# Colors
+TOKEN_COLOR = "#81c784"     # Green
+EMBED_COLOR = "#ffb74d"     # Orange
+ARROW_COLOR = "#90a4ae"     # Gray
+
 
 class TokenizationFlow(Scene):
+    # Colors the direct GIF/WebP encoder builds its palette from
+    palette = [TOKEN_COLOR, EMBED_COLOR, ARROW_COLOR, GRAY, WHITE]
+    text = "I love transformers"
+    # Data read while rendering, relative to this folder; render.py hashes it
+    # (the posts are the training text when data/bpe/ is missing)
+    inputs = ("data/bpe/vocab.json", "data/bpe/merges.txt", "../content/posts")
+    tokenizer_dir = DATA
+
+    def load_tokenizer(self):
+        """The vocabulary in tokenizer_dir, or one trained on the posts in memory."""
+        try:
+            tokenizer = load(self.tokenizer_dir)
+        except FileNotFoundError:
+            tokenizer = train(corpus())
+            logger.info("No vocabulary in %s; trained %d tokens on %s in memory",
+                        self.tokenizer_dir, len(tokenizer.encoder), POSTS)
+            return tokenizer
+        logger.info("BPE vocabulary: %s (%d tokens)", self.tokenizer_dir, len(tokenizer.encoder))
+        return tokenizer
+
     def construct(self):
-        # Colors
-        TOKEN_COLOR = "#81c784"     # Green
-        EMBED_COLOR = "#ffb74d"     # Orange
-        ARROW_COLOR = "#90a4ae"     # Gray
-        
+        tokenizer = self.load_tokenizer()
+        token_ids = tokenizer.encode(self.text)
+
         # ============ STEP 1: Static sentence at top ============
-        input_label = Text("Input Sentence", font_size=20, color=GRAY)
+        input_label = cached_text("Input Sentence", font_size=20, color=GRAY)
         input_label.to_edge(UP, buff=0.4)
         
-        sentence = Text("I love transformers", font_size=36, weight=BOLD)
+        sentence = cached_text(self.text, font_size=36, weight=BOLD)
         sentence.next_to(input_label, DOWN, buff=0.15)
         
         self.add(input_label, sentence)
         self.wait(0.5)
         
         # ============ STEP 2: Vocabulary lookup table ============
-        words = ["I", "love", "transformers"]
-        token_ids = [42, 891, 2048]
-        
+        # One row per distinct token; the leading space (␣) is part of the token
+        rows = list(dict.fromkeys((tokenizer.token_label(tid), str(tid)) for tid in token_ids))
+
         # Create table with strings (Table handles text creation internally)
         table = Table(
-            [[word, str(tid)] for word, tid in zip(words, token_ids)],
-            col_labels=[Text("Word", font_size=32, weight=BOLD), Text("Token ID", font_size=32, weight=BOLD)],
+            [list(row) for row in rows],
+            col_labels=[cached_text("Token", font_size=32, weight=BOLD), cached_text("Token ID", font_size=32, weight=BOLD)],
             include_outer_lines=True,
             line_config={"stroke_width": 1, "color": GRAY},
             v_buff=0.3,
             h_buff=0.6,
             element_to_mobject_config={"font_size": 32}
         )
-        table.scale(0.75)
+        table.scale(min(0.75, 3.2 / table.height))
         table.move_to(ORIGIN + UP * 0.2)
         
         # Arrow from sentence to table with label
@@ -66,7 +101,7 @@ class TokenizationFlow(Scene):
             color=ARROW_COLOR,
             stroke_width=2
         )
-        arrow_label = Text("Token ID Lookup", font_size=18, color=GRAY)
+        arrow_label = cached_text("Token ID Lookup", font_size=18, color=GRAY)
         arrow_label.next_to(arrow_to_table, RIGHT, buff=0.1)
         
         self.play(
@@ -78,33 +113,12 @@ class TokenizationFlow(Scene):
         self.wait(1)
         
         # ============ STEP 3: Token ID array ============
-        token_boxes = VGroup()
-        for tid in token_ids:
-            text = Text(str(tid), font_size=28, color=TOKEN_COLOR)
-            box = RoundedRectangle(
-                corner_radius=0.12,
-                height=0.7,
-                width=0.9,
-                stroke_color=TOKEN_COLOR,
-                stroke_width=2,
-                fill_color=TOKEN_COLOR,
-                fill_opacity=0.15
-            )
-            text.move_to(box.get_center())
-            token_boxes.add(VGroup(box, text))
-        
-        token_boxes.arrange(RIGHT, buff=0.15)
-        
-        # Array brackets
-        left_bracket = Text("[", font_size=40, color=TOKEN_COLOR)
-        right_bracket = Text("]", font_size=40, color=TOKEN_COLOR)
-        left_bracket.next_to(token_boxes, LEFT, buff=0.1)
-        right_bracket.next_to(token_boxes, RIGHT, buff=0.1)
-        
-        token_array = VGroup(left_bracket, token_boxes, right_bracket)
+        token_array = make_token_array(token_ids, TOKEN_COLOR)
+        if token_array.width > config.frame_width - 3:
+            token_array.scale_to_fit_width(config.frame_width - 3)
         token_array.next_to(table, DOWN, buff=0.8)
         
-        array_label = Text("Token IDs", font_size=20, color=GRAY)
+        array_label = cached_text("Token IDs", font_size=20, color=GRAY)
         array_label.next_to(token_array, LEFT, buff=0.4)
         
         # Arrow from table to token array
@@ -134,7 +148,7 @@ class TokenizationFlow(Scene):
             fill_color=EMBED_COLOR,
             fill_opacity=0.2
         )
-        embed_text = Text("Input", font_size=24, color=EMBED_COLOR)
+        embed_text = cached_text("Input", font_size=24, color=EMBED_COLOR)
         embed_text.move_to(embed_box.get_center())
         embed_layer = VGroup(embed_box, embed_text)
         embed_layer.next_to(token_array, DOWN, buff=0.5)
@@ -153,4 +167,5 @@ class TokenizationFlow(Scene):
             run_time=0.6
         )
         self.wait(1.5)
+        log_text_cache_stats(type(self).__name__)
 
@@ -0,0 +1,62 @@
+"""
+Cached sin/cos waveform glyphs.
+
+A glyph is a wave plus the two axis lines of the Axes it used to be drawn
+on: x from 0 to 2*pi, y from -1.2 to 1.2. Each (frequency, sin/cos) shape
+is sampled once with NumPy into a unit square and stamped out with copy(),
+then scaled, colored and placed. No Axes or per-point Python callbacks are
+involved, so a row of 128 boxes costs 128 copies of at most 64 shapes.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from manim import VGroup, VMobject, Line, WHITE, LEFT, RIGHT, UP, DOWN
+
+# Axes ranges the glyphs reproduce
+X_MAX = 2 * np.pi
+Y_RANGE = 2.4
+# Samples per cycle; every wave gets at least MIN_SAMPLES points
+SAMPLES_PER_CYCLE = 24
+MIN_SAMPLES = 48
+
+
+def wave_points(freq, is_sin, samples=None):
+    """
+    (samples, 3) points of sin(freq*t) or cos(freq*t) for t in [0, 2*pi],
+    mapped into the unit square centered on the origin.
+    """
+    if samples is None:
+        samples = max(MIN_SAMPLES, SAMPLES_PER_CYCLE * freq) + 1
+    t = np.linspace(0.0, X_MAX, samples)
+    y = np.sin(freq * t) if is_sin else np.cos(freq * t)
+    points = np.zeros((samples, 3))
+    points[:, 0] = t / X_MAX - 0.5
+    points[:, 1] = y / Y_RANGE
+    return points
+
+
+@lru_cache(maxsize=None)
+def _glyph(freq, is_sin):
+    """Unit-square template: VGroup(VGroup(x_axis, y_axis), wave)."""
+    # x axis sits at y = 0, the y axis at x = 0 (the left edge)
+    x_axis = Line(0.5 * LEFT, 0.5 * RIGHT)
+    y_axis = Line(0.5 * LEFT + 0.5 * DOWN, 0.5 * LEFT + 0.5 * UP)
+    wave = VMobject().set_points_smoothly(wave_points(freq, is_sin))
+    return VGroup(VGroup(x_axis, y_axis), wave)
+
+
+def make_waveform(freq, is_sin, size, color=WHITE, wave_width=2.5, axis_width=1.5):
+    """
+    Waveform glyph of sin/cos(freq * t) in a size x size square:
+    VGroup(axes, wave). Position it with move_to, like the Axes it replaces.
+    """
+    glyph = _glyph(int(freq), bool(is_sin)).copy().scale(size)
+    axes, wave = glyph
+    axes.set_stroke(color, axis_width)
+    wave.set_stroke(color, wave_width).set_fill(opacity=0)
+    return glyph
+
+
+def glyph_cache_info():
+    return _glyph.cache_info()
@@ -1,12 +1,73 @@
 """
 Word2Vec Analogy Visualization - 2D Vector Space
 Run with: manim -pqh --format png word2vec.py Word2VecAnalogy
+
+With an embedding file at data/glove.6B.300d.txt (or embeddings_file set to
+another word2vec/GloVe/.npy file) the analogy is solved over the whole
+vocabulary and the vectors are drawn at their PCA positions; without one
+the hand-placed toy positions are used, which only cover the default
+queen - woman + man analogy.
 """
 
+from pathlib import Path
+
 from manim import *
 
+from background_cache import BackgroundCacheScene
+from embeddings import load
+from tex_batch import escape_tex, precompile_tex
+
+# Toy 2-D positions: queen = woman + royalty, king = man + royalty. They only
+# answer the default analogy; any other one needs the embedding file.
+TOY_ANALOGY = ("queen", "woman", "man", "king")
+TOY_POSITIONS = {"queen": (3, 4), "woman": (1, 3), "man": (2, 1), "king": (4, 2)}
+
+
+def tex_word(word):
+    """A vocabulary word for math mode: plain if ASCII letters, else escaped \\text."""
+    return word if word.isascii() and word.isalpha() else rf"\text{{{escape_tex(word)}}}"
+
+
+class Word2VecAnalogy(BackgroundCacheScene):
+    # Data read while rendering, relative to this folder; render.py hashes it
+    inputs = ("data/glove.6B.300d.txt",)
+    embeddings_file = Path(__file__).resolve().parent / inputs[0]
+    # a - b + c ≈ ?
+    analogy = ("queen", "woman", "man")
+
+    def analogy_positions(self):
+        """
+        (a, b, c, answer, positions (4, 2) in axes units). The answer is the
+        nearest all-letter word to a - b + c by cosine over the full
+        vocabulary (GloVe also has tokens like "&" and "#").
+        """
+        a, b, c = self.analogy
+        if not self.embeddings_file.exists():
+            if tuple(self.analogy) != TOY_ANALOGY[:3]:
+                raise FileNotFoundError(
+                    f"No embeddings at {self.embeddings_file}; the toy positions only cover "
+                    f"{' - '.join(TOY_ANALOGY[:2])} + {TOY_ANALOGY[2]}"
+                )
+            logger.info("No embeddings at %s; using toy positions", self.embeddings_file)
+            return (*TOY_ANALOGY, np.array([TOY_POSITIONS[w] for w in TOY_ANALOGY], float))
+
+        emb = load(self.embeddings_file)
+        matches = emb.analogy(a, b, c, k=10)
+        answer, score = next(((w, s) for w, s in matches if w.isalpha()), matches[0])
+        logger.info("%s - %s + %s ≈ %s (cosine %.3f)", a, b, c, answer, score)
+        points = emb.project([a, b, c, answer], emb.fit_pca())
+
+        # Everything drawn: the four words and the two intermediate tips
+        drawn = np.vstack([points, points[0] - points[1], points[0] - points[1] + points[2]])
+        # Flip each axis so most of the picture is in the positive quadrant,
+        # then scale it into the axes' [-1, 5] range
+        points *= np.where(drawn.mean(axis=0) < 0, -1.0, 1.0)
+        drawn *= np.where(drawn.mean(axis=0) < 0, -1.0, 1.0)
+        scale = 4.5 / max(drawn.max(), 1e-6)
+        if drawn.min() < 0:
+            scale = min(scale, 0.9 / -drawn.min())
+        return a, b, c, answer, points * scale
 
-class Word2VecAnalogy(Scene):
     def construct(self):
         # Colors
         QUEEN_COLOR = "#e91e63"  # Pink
@@ -15,6 +76,13 @@ class Word2VecAnalogy(Scene):
         KING_COLOR = "#ff9800"   # Orange
         RESULT_COLOR = "#4caf50" # Green
 
+        a, b, c, answer, (q, w, m, k) = self.analogy_positions()
+        formula_tex = r"\vec{%s} - \vec{%s} + \vec{%s} \approx \vec{%s}" % tuple(
+            tex_word(word) for word in (a, b, c, answer)
+        )
+
+        precompile_tex(math=[r"\approx", formula_tex])
+
         # Create coordinate system
         axes = Axes(
             x_range=[-1, 5, 1],
@@ -25,28 +93,23 @@ class Word2VecAnalogy(Scene):
         )
         axes.move_to(ORIGIN)
 
-        # Define vector positions (simplified 2D representation)
-        # queen = woman + royalty_direction
-        # king = man + royalty_direction
-        # So: queen - woman + man = king
-        
+        # Vector positions (2D): q - w + m should land near k
+
         origin = axes.c2p(0, 0)
-        queen_end = axes.c2p(3, 4)
-        woman_end = axes.c2p(1, 3)
-        man_end = axes.c2p(2, 1)
-        king_end = axes.c2p(4, 2)
+        queen_end = axes.c2p(*q)
+        king_end = axes.c2p(*k)
         
         # Vector: queen (from origin)
         queen_vec = Arrow(origin, queen_end, buff=0, color=QUEEN_COLOR, stroke_width=4)
-        queen_label = Text("queen", font_size=24, color=QUEEN_COLOR)
+        queen_label = Text(a, font_size=24, color=QUEEN_COLOR)
         queen_label.next_to(queen_end, UP + RIGHT, buff=0.1)
 
         # Vector: -woman (shown as dashed from queen tip, going backwards)
         # queen - woman means: start at queen, go in opposite direction of woman
         woman_vec_neg_start = queen_end
-        woman_vec_neg_end = axes.c2p(3 - 1, 4 - 3)  # queen - woman
+        woman_vec_neg_end = axes.c2p(*(q - w))  # queen - woman
         woman_vec = Arrow(woman_vec_neg_start, woman_vec_neg_end, buff=0, color=WOMAN_COLOR, stroke_width=4)
-        woman_label = Text("-woman", font_size=24, color=WOMAN_COLOR)
+        woman_label = Text(f"-{b}", font_size=24, color=WOMAN_COLOR)
         woman_label.next_to(
             (np.array(woman_vec_neg_start) + np.array(woman_vec_neg_end)) / 2,
             LEFT, buff=0.2
@@ -54,9 +117,9 @@ class Word2VecAnalogy(Scene):
 
         # Vector: +man (from the result of queen-woman)
         man_vec_start = woman_vec_neg_end
-        man_vec_end = axes.c2p(3 - 1 + 2, 4 - 3 + 1)  # queen - woman + man
+        man_vec_end = axes.c2p(*(q - w + m))  # queen - woman + man
         man_vec = Arrow(man_vec_start, man_vec_end, buff=0, color=MAN_COLOR, stroke_width=4)
-        man_label = Text("+man", font_size=24, color=MAN_COLOR)
+        man_label = Text(f"+{c}", font_size=24, color=MAN_COLOR)
         man_label.next_to(
             (np.array(man_vec_start) + np.array(man_vec_end)) / 2,
             DOWN, buff=0.2
@@ -69,7 +132,7 @@ class Word2VecAnalogy(Scene):
         
         # King vector (for comparison - should be very close to result)
         king_vec = Arrow(origin, king_end, buff=0, color=KING_COLOR, stroke_width=4, max_stroke_width_to_length_ratio=10)
-        king_label = Text("king", font_size=24, color=KING_COLOR)
+        king_label = Text(answer, font_size=24, color=KING_COLOR)
         king_label.next_to(king_end, RIGHT, buff=0.15)
 
         # Approx label near the result
@@ -78,14 +141,14 @@ class Word2VecAnalogy(Scene):
 
         # Formula at bottom
         formula = MathTex(
-            r"\vec{queen} - \vec{woman} + \vec{man} \approx \vec{king}",
+            formula_tex,
             font_size=32,
             color=WHITE
         )
         formula.to_edge(DOWN, buff=0.5)
 
         # Add everything with animations
-        self.add(axes)
+        self.add_background(axes)
         
         self.play(GrowArrow(queen_vec), FadeIn(queen_label))
         self.wait(0.5)